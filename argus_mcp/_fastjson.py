@@ -0,0 +1,45 @@
+"""JSON encode/decode helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install 'argus-mcp[speedups]'``).
+Without it these fall back to the stdlib :mod:`json` module with
+equivalent output: UTF-8 bytes, compact separators unless *indent* is
+set, and non-string dict keys coerced to strings.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialise *obj* to JSON bytes (two-space indent when *indent* is set)."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    if indent:
+        text = json.dumps(obj, default=default, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, default=default, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from *data*."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,44 @@
+"""Atomic file replacement shared by the session, skill-state and client-config writers."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import stat
+import tempfile
+from typing import Optional
+
+# Process umask, read once: mkstemp creates files as 0600, and a new file
+# should instead get the mode a plain ``open(path, "w")`` would give it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_atomic(path: str, payload: bytes) -> None:
+    """Write *payload* to *path* via a sibling temp file + ``os.replace``.
+
+    Readers never see a partially written file.  A symlinked *path* has its
+    target replaced, so the link survives.  An existing file keeps its mode,
+    and its owner and group where the process is allowed to set them.
+    """
+    path = os.path.realpath(path)
+    try:
+        st: Optional[os.stat_result] = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        if st is None:
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        else:
+            os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+            if hasattr(os, "chown"):
+                with contextlib.suppress(OSError):
+                    os.chown(tmp_path, st.st_uid, st.st_gid)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
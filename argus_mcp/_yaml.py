@@ -0,0 +1,13 @@
+"""PyYAML safe loader/dumper classes, libyaml-backed when available.
+
+PyYAML only provides ``CSafeLoader``/``CSafeDumper`` when it was built
+against libyaml; otherwise these fall back to the pure-Python classes,
+which accept the same documents and produce the same output.
+"""
+
+from __future__ import annotations
+
+import yaml  # type: ignore[import-untyped]
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from typing import Any, Dict, FrozenSet, List
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from argus_mcp import _fastjson
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,8 @@ class GroupManager:
         self._server_group: Dict[str, str] = {}
         # group_name → set of server_names
         self._group_servers: Dict[str, set[str]] = defaultdict(set)
+        # Cached JSON encoding of to_dict(); cleared on every mutation
+        self._serialized: Optional[bytes] = None
 
         for name, cfg in backends.items():
             group = getattr(cfg, "group", DEFAULT_GROUP) or DEFAULT_GROUP
@@ -74,6 +78,7 @@ class GroupManager:
 
     def add_server(self, server_name: str, group: str = DEFAULT_GROUP) -> None:
         """Register a new server ↔ group mapping."""
+        self._serialized = None
         old_group = self._server_group.get(server_name)
         if old_group is not None and old_group != group:
             self._group_servers[old_group].discard(server_name)
@@ -84,6 +89,7 @@ class GroupManager:
 
     def remove_server(self, server_name: str) -> None:
         """Remove a server from its group."""
+        self._serialized = None
         group = self._server_group.pop(server_name, None)
         if group is not None:
             self._group_servers[group].discard(server_name)
@@ -105,3 +111,9 @@ class GroupManager:
             "total_groups": self.group_count,
             "total_servers": len(self._server_group),
         }
+
+    def to_bytes(self) -> bytes:
+        """Return :meth:`to_dict` encoded as JSON, cached until the next mutation."""
+        if self._serialized is None:
+            self._serialized = _fastjson.dumps(self.to_dict())
+        return self._serialized
@@ -63,6 +63,29 @@ def _find_config_file() -> str:
 # ── ``argus-mcp server`` ─────────────────────────────────────────────
 
 
+def _install_event_loop(loop_choice: str) -> str:
+    """Install the requested event loop policy and return the one in use.
+
+    ``auto`` uses uvloop when it is installed and falls back to the stock
+    asyncio loop otherwise; ``uvloop`` requires it and exits if missing.
+    """
+    if loop_choice == "asyncio":
+        return "asyncio"
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        if loop_choice == "uvloop":
+            print(
+                "❌ Error: --loop uvloop requested but uvloop is not installed.\n"
+                "   Install it with: pip install 'argus-mcp[speedups]'",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        return "asyncio"
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return "uvloop"
+
+
 async def _run_server(
     host: str,
     port: int,
@@ -229,6 +252,9 @@ def _detach_server(args: argparse.Namespace) -> None:
     cfg = getattr(args, "config", None)
     if cfg is not None:
         cmd += ["--config", cfg]
+    loop_choice = getattr(args, "loop", "auto")
+    if loop_choice != "auto":
+        cmd += ["--loop", loop_choice]
 
     # Open the log directory for stdout/stderr redirection
     from argus_mcp.constants import LOG_DIR
@@ -306,6 +332,9 @@ def _cmd_server(args: argparse.Namespace) -> None:
     session_name = getattr(args, "name", None) or auto_name(args.port, DEFAULT_PORT)
     config_path = getattr(args, "config", None) or ""
 
+    loop_name = _install_event_loop(getattr(args, "loop", "auto"))
+    module_logger.debug("Using %s event loop.", loop_name)
+
     _write_pid_file(session_name, args.host, args.port, config_path)
     try:
         asyncio.run(
@@ -718,6 +747,13 @@ def _build_parser() -> argparse.ArgumentParser:
         metavar="PATH",
         help=("Path to configuration file (YAML). " "Default: auto-detect config.yaml/config.yml"),
     )
+    sp_server.add_argument(
+        "--loop",
+        type=str,
+        default="auto",
+        choices=["auto", "asyncio", "uvloop"],
+        help="Event loop implementation (default: auto — uvloop when installed)",
+    )
     sp_server.add_argument(
         "-d",
         "--detach",
@@ -7,8 +7,12 @@ Defines the client-side data types for the registry API contract
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
+# Length descriptions are cut to in table views
+_SHORT_DESCRIPTION_LEN = 60
+
 
 @dataclass(frozen=True)
 class ToolDefinition:
@@ -18,6 +22,14 @@ class ToolDefinition:
     description: str = ""
     input_schema: Dict[str, Any] = field(default_factory=dict)
 
+    @cached_property
+    def short_description(self) -> str:
+        """:attr:`description` cut to 60 characters (plus ``…``), computed once."""
+        desc = self.description
+        if len(desc) > _SHORT_DESCRIPTION_LEN:
+            return desc[:_SHORT_DESCRIPTION_LEN] + "…"
+        return desc
+
 
 @dataclass(frozen=True)
 class ServerEntry:
@@ -7,9 +7,9 @@ These models serve dual purpose:
 
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ServiceState(str, Enum):
@@ -132,6 +132,12 @@ class BackendStatusRecord(BaseModel):
     last_latency_ms: Optional[float] = None
     error: Optional[str] = None
     conditions: List[BackendCondition] = Field(default_factory=list)
+    # JSON-ready copies of ``conditions``, built once when each is appended
+    _condition_dicts: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
+
+    def _append_condition(self, condition: BackendCondition) -> None:
+        self.conditions.append(condition)
+        self._condition_dicts.append(condition.model_dump(mode="json"))
 
     def transition(self, new_phase: BackendPhase, message: str = "") -> None:
         """Transition to *new_phase* and append a condition entry.
@@ -149,7 +155,7 @@ class BackendStatusRecord(BaseModel):
             status = "Warning"
         else:
             status = "Error"
-        self.conditions.append(
+        self._append_condition(
             BackendCondition(
                 type=new_phase.value,
                 status=status,
@@ -163,7 +169,7 @@ class BackendStatusRecord(BaseModel):
 
     def add_condition(self, cond_type: str, status: str, message: str = "") -> None:
         """Append a freeform condition without changing phase."""
-        self.conditions.append(BackendCondition(type=cond_type, status=status, message=message))
+        self._append_condition(BackendCondition(type=cond_type, status=status, message=message))
 
     @property
     def is_operational(self) -> bool:
@@ -175,6 +181,11 @@ class BackendStatusRecord(BaseModel):
         """Return the 10 most recent conditions (newest first)."""
         return list(reversed(self.conditions[-10:]))
 
+    @property
+    def recent_condition_dicts(self) -> List[Dict[str, Any]]:
+        """Pre-serialised form of :attr:`recent_conditions` (newest first)."""
+        return self._condition_dicts[:-11:-1]
+
 
 class CapabilityInfo(BaseModel):
     """Aggregated capability information across all backends."""
@@ -10,7 +10,7 @@ import asyncio
 import logging
 from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
 from mcp import types as mcp_types
 
@@ -72,6 +72,8 @@ class ArgusService:
         self._error_message: Optional[str] = None
         self._config_path: Optional[str] = None
         self._config_data: Optional[Dict[str, Any]] = None
+        # Backend names from the current config, refreshed on start/reload
+        self._backend_names: FrozenSet[str] = frozenset()
 
         # Bridge components
         self._manager: ClientManager = ClientManager()
@@ -158,6 +160,11 @@ class ArgusService:
         """Raw config data loaded from disk (read-only snapshot)."""
         return self._config_data
 
+    @property
+    def backend_names(self) -> FrozenSet[str]:
+        """Names of the backends defined in the current config."""
+        return self._backend_names
+
     @property
     def started_at(self) -> Optional[datetime]:
         return self._started_at
@@ -305,6 +312,7 @@ class ArgusService:
             self.emit_event("config", f"Loading configuration: {config_path}")
             config = load_and_validate_config(config_path)
             self._config_data = config
+            self._backend_names = frozenset(config)
             self._backends_total = len(config)
             logger.info("Configuration loaded: %d backend(s) defined.", self._backends_total)
             self.emit_event(
@@ -517,6 +525,7 @@ class ArgusService:
 
             # Update internal state
             self._config_data = new_config
+            self._backend_names = frozenset(new_config)
             self._backends_total = len(new_config)
             self._backends_connected = self._manager.get_active_session_count()
 
@@ -598,7 +607,7 @@ class ArgusService:
                 "error": f"Cannot reconnect in state: {self._state.value}",
             }
 
-        if not self._config_data or name not in self._config_data:
+        if name not in self._backend_names or not self._config_data:
             return {
                 "name": name,
                 "reconnected": False,
@@ -778,14 +787,28 @@ class ArgusService:
         limit: int = 100,
         since: Optional[str] = None,
         severity: Optional[str] = None,
+        after: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Return recent events, optionally filtered."""
-        result = list(self._events)
-        if since:
-            result = [e for e in result if e["timestamp"] > since]
-        if severity:
-            result = [e for e in result if e["severity"] == severity]
-        return result[-limit:]
+        """Return the last *limit* matching events, oldest first.
+
+        Filters in a single pass over a snapshot of the buffer, so it is
+        safe to call while new events are being emitted.  *after* is an
+        event-ID cursor: only events emitted after it are returned (all
+        buffered events if it has already been evicted or is unknown).
+        """
+        events = tuple(self._events)
+        if after is not None:
+            # Scan from the newest end; a caught-up cursor is found immediately
+            for idx in range(len(events) - 1, -1, -1):
+                if events[idx]["id"] == after:
+                    events = events[idx + 1 :]
+                    break
+        matches = (
+            e
+            for e in events
+            if (not since or e["timestamp"] > since) and (not severity or e["severity"] == severity)
+        )
+        return list(deque(matches, maxlen=limit))
 
     def subscribe(self) -> asyncio.Queue[Dict[str, Any]]:
         """Create a new event subscriber queue."""
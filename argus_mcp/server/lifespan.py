@@ -14,7 +14,12 @@ from typing import Any, AsyncIterator, Optional
 
 from starlette.applications import Starlette
 
-from argus_mcp.constants import SERVER_NAME, SERVER_VERSION
+from argus_mcp.constants import (
+    SERVER_NAME,
+    SERVER_VERSION,
+    SSE_PATH,
+    STREAMABLE_HTTP_PATH,
+)
 from argus_mcp.display.console import (
     disp_console_status,
     gen_status_info,
@@ -280,8 +285,14 @@ async def app_lifespan(app: Starlette) -> AsyncIterator[None]:
         mgmt_app.state.argus_service = service  # type: ignore[attr-defined]
         # Forward host/port/transport so the status endpoint can build
         # correct URLs (the mgmt sub-app has its own State object).
-        mgmt_app.state.host = getattr(app_s, "host", "127.0.0.1")  # type: ignore[attr-defined]
-        mgmt_app.state.port = getattr(app_s, "port", 0)  # type: ignore[attr-defined]
+        host = getattr(app_s, "host", "127.0.0.1")
+        port = getattr(app_s, "port", 0)
+        mgmt_app.state.host = host  # type: ignore[attr-defined]
+        mgmt_app.state.port = port  # type: ignore[attr-defined]
+        mgmt_app.state.sse_url = f"http://{host}:{port}{SSE_PATH}"  # type: ignore[attr-defined]
+        mgmt_app.state.streamable_http_url = (  # type: ignore[attr-defined]
+            f"http://{host}:{port}{STREAMABLE_HTTP_PATH}"
+        )
         mgmt_app.state.transport_type = getattr(app_s, "transport_type", "streamable-http")  # type: ignore[attr-defined]
 
     startup_ok = False
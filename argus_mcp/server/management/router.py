@@ -5,14 +5,16 @@ Authentication is added in Phase 0.3.
 """
 
 import asyncio
-import json
+import hashlib
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from starlette.requests import Request
-from starlette.responses import JSONResponse, StreamingResponse
+from starlette.responses import JSONResponse, Response, StreamingResponse
 from starlette.routing import Route, Router
 
+from argus_mcp import _fastjson
+from argus_mcp.bridge.groups import GroupManager
 from argus_mcp.constants import SERVER_VERSION, SSE_PATH, STREAMABLE_HTTP_PATH
 from argus_mcp.runtime.service import ArgusService
 from argus_mcp.server.management.schemas import (
@@ -33,6 +35,7 @@ from argus_mcp.server.management.schemas import (
     SessionDetail,
     SessionsResponse,
     ShutdownResponse,
+    SnapshotResponse,
     StatusConfig,
     StatusResponse,
     StatusService,
@@ -44,6 +47,19 @@ logger = logging.getLogger(__name__)
 
 SSE_HEARTBEAT_INTERVAL = 30  # seconds
 
+# Strong references to fire-and-forget tasks (e.g. deferred shutdown)
+_BG_TASKS: Set["asyncio.Task[None]"] = set()
+
+# Query-parameter bounds for /events
+_EVENTS_LIMIT_MAX = 10000
+_EVENT_SEVERITIES = frozenset({"debug", "info", "warning", "error"})
+
+# Sections /snapshot can return; ``?include=`` selects a subset
+_SNAPSHOT_SECTIONS = ("health", "status", "backends", "capabilities", "events")
+
+# Default for the optional ``timeout_seconds`` body field of /shutdown
+_SHUTDOWN_TIMEOUT_DEFAULT = 30
+
 
 # ── Helpers ──────────────────────────────────────────────────────────────
 
@@ -61,6 +77,33 @@ def _error_json(error: str, message: str, status_code: int = 500) -> JSONRespons
     return JSONResponse(body.model_dump(), status_code=status_code)
 
 
+def _parse_int(value: Optional[str], default: int, lo: int, hi: int) -> int:
+    """Parse a query parameter as an int clamped to ``[lo, hi]``."""
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        return default
+    return max(lo, min(hi, parsed))
+
+
+def _with_etag(request: Request, response: Response) -> Response:
+    """Tag *response* with an ETag of its body; answer 304 if the client has it.
+
+    Lets pollers revalidate unchanged payloads via ``If-None-Match``
+    without re-downloading or re-parsing them.
+    """
+    etag = '"' + hashlib.sha256(response.body).hexdigest()[:32] + '"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
 def _get_feature_flags() -> Dict[str, bool]:
     """Return feature flags from the mcp_server instance, or empty dict."""
     from argus_mcp.server.app import mcp_server
@@ -76,7 +119,11 @@ def _get_feature_flags() -> Dict[str, bool]:
 
 async def handle_health(request: Request) -> JSONResponse:
     """Liveness probe — always public, returns 200 when process is alive."""
-    service = _get_service(request)
+    return JSONResponse(_build_health(_get_service(request)).model_dump())
+
+
+def _build_health(service: ArgusService) -> HealthResponse:
+    """Build the ``/health`` payload."""
     svc_status = service.get_status()
 
     # Derive health status
@@ -89,7 +136,7 @@ async def handle_health(request: Request) -> JSONResponse:
     else:
         health = "unhealthy"
 
-    resp = HealthResponse(
+    return HealthResponse(
         status=health,
         uptime_seconds=svc_status.uptime_seconds,
         version=SERVER_VERSION,
@@ -99,23 +146,31 @@ async def handle_health(request: Request) -> JSONResponse:
             healthy=svc_status.backends_connected,  # approximate for now
         ),
     )
-    return JSONResponse(resp.model_dump())
 
 
 # ── GET /manage/v1/status ───────────────────────────────────────────────
 
 
-async def handle_status(request: Request) -> JSONResponse:
+async def handle_status(request: Request) -> Response:
     """Full service status including runtime state, config, and transport."""
-    service = _get_service(request)
+    resp = _build_status(request, _get_service(request))
+    return JSONResponse(resp.model_dump())
+
+
+def _build_status(request: Request, service: ArgusService) -> StatusResponse:
+    """Build the ``/status`` payload."""
     svc_status = service.get_status()
 
-    host = getattr(request.app.state, "host", "127.0.0.1")
-    port = getattr(request.app.state, "port", 0)
-    sse_url = f"http://{host}:{port}{SSE_PATH}"
-    streamable_http_url = f"http://{host}:{port}{STREAMABLE_HTTP_PATH}"
+    state = request.app.state
+    host = getattr(state, "host", "127.0.0.1")
+    port = getattr(state, "port", 0)
+    # URLs are precomputed by the lifespan hook; build them only if it did not run.
+    sse_url = getattr(state, "sse_url", None) or f"http://{host}:{port}{SSE_PATH}"
+    streamable_http_url = (
+        getattr(state, "streamable_http_url", None) or f"http://{host}:{port}{STREAMABLE_HTTP_PATH}"
+    )
 
-    resp = StatusResponse(
+    return StatusResponse(
         service=StatusService(
             name=svc_status.server_name,
             version=svc_status.server_version,
@@ -136,7 +191,6 @@ async def handle_status(request: Request) -> JSONResponse:
         ),
         feature_flags=_get_feature_flags(),
     )
-    return JSONResponse(resp.model_dump())
 
 
 # ── GET /manage/v1/backends ─────────────────────────────────────────────
@@ -144,7 +198,11 @@ async def handle_status(request: Request) -> JSONResponse:
 
 async def handle_backends(request: Request) -> JSONResponse:
     """List all backend server connections with their status."""
-    service = _get_service(request)
+    return JSONResponse(_build_backends(_get_service(request)).model_dump())
+
+
+def _build_backends(service: ArgusService) -> BackendsResponse:
+    """Build the ``/backends`` payload."""
     route_map = service.registry.get_route_map()
 
     # Count capabilities per backend
@@ -168,8 +226,7 @@ async def handle_backends(request: Request) -> JSONResponse:
             tool_backends[svr] = tool_backends.get(svr, 0) + 1
 
     for resource in service.resources:
-        rname = resource.name if hasattr(resource, "name") else str(resource.uri)
-        entry = route_map.get(rname)
+        entry = route_map.get(resource.name)
         if entry:
             svr = entry[0]
             resource_backends[svr] = resource_backends.get(svr, 0) + 1
@@ -180,10 +237,14 @@ async def handle_backends(request: Request) -> JSONResponse:
             svr = entry[0]
             prompt_backends[svr] = prompt_backends.get(svr, 0) + 1
 
-    backends = []
     svc_status = service.get_status()
+    backend_infos = svc_status.backends
+    # Pre-sized to the known backend count and filled by index below
+    backends: List[Any] = [None] * len(backend_infos)
     health_checker = service.health_checker
-    for bi in svc_status.backends:
+    gm: Optional[GroupManager] = service.group_manager  # type: ignore[assignment]
+    cm = service.manager
+    for i, bi in enumerate(backend_infos):
         # Use real health data when available
         health_detail: Dict[str, Any] = {"status": "unknown"}
         if health_checker is not None:
@@ -197,53 +258,44 @@ async def handle_backends(request: Request) -> JSONResponse:
             health_detail = {"status": "healthy"}
 
         # Determine group from group manager
-        group_name = "default"
-        if service.group_manager is not None:
-            from argus_mcp.bridge.groups import GroupManager
-
-            gm: GroupManager = service.group_manager  # type: ignore[assignment]
-            group_name = gm.group_of(bi.name)
+        group_name = gm.group_of(bi.name) if gm is not None else "default"
 
         # Extract status phase and conditions from BackendStatusRecord
         status_phase = "pending"
         status_error: Optional[str] = None
         status_conditions: list = []
-        cm = service.manager
         if cm is not None:
             sr = cm.get_status_record(bi.name)
             if sr is not None:
                 status_phase = sr.phase.value
                 status_error = sr.error
-                status_conditions = [c.model_dump(mode="json") for c in sr.recent_conditions]
-
-        backends.append(
-            BackendDetail(
-                name=bi.name,
-                type=bi.type,
-                group=group_name,
-                phase=status_phase,
-                state="connected" if bi.connected else "disconnected",
-                error=bi.error or status_error,
-                capabilities=BackendCapabilities(
-                    tools=tool_backends.get(bi.name, 0),
-                    resources=resource_backends.get(bi.name, 0),
-                    prompts=prompt_backends.get(bi.name, 0),
-                ),
-                health=BackendHealth(
-                    status=health_detail.get("status", "unknown"),
-                ),
-                conditions=status_conditions,
-            )
+                status_conditions = sr.recent_condition_dicts
+
+        backends[i] = BackendDetail(
+            name=bi.name,
+            type=bi.type,
+            group=group_name,
+            phase=status_phase,
+            state="connected" if bi.connected else "disconnected",
+            error=bi.error or status_error,
+            capabilities=BackendCapabilities(
+                tools=tool_backends.get(bi.name, 0),
+                resources=resource_backends.get(bi.name, 0),
+                prompts=prompt_backends.get(bi.name, 0),
+            ),
+            health=BackendHealth(
+                status=health_detail.get("status", "unknown"),
+            ),
+            conditions=status_conditions,
         )
 
-    resp = BackendsResponse(backends=backends)
-    return JSONResponse(resp.model_dump())
+    return BackendsResponse(backends=backends)
 
 
 # ── GET /manage/v1/groups ───────────────────────────────────────────────
 
 
-async def handle_groups(request: Request) -> JSONResponse:
+async def handle_groups(request: Request) -> Response:
     """List all server groups and their members.
 
     Query parameters:
@@ -255,8 +307,6 @@ async def handle_groups(request: Request) -> JSONResponse:
     if service.group_manager is None:
         return JSONResponse({"groups": {}, "total_groups": 0, "total_servers": 0})
 
-    from argus_mcp.bridge.groups import GroupManager
-
     gm: GroupManager = service.group_manager  # type: ignore[assignment]
 
     if filter_group:
@@ -271,25 +321,43 @@ async def handle_groups(request: Request) -> JSONResponse:
             }
         )
 
-    return JSONResponse(gm.to_dict())
+    return Response(gm.to_bytes(), media_type="application/json")
 
 
 # ── GET /manage/v1/capabilities ─────────────────────────────────────────
 
 
-async def handle_capabilities(request: Request) -> JSONResponse:
-    """Aggregated capabilities from all connected backends."""
-    service = _get_service(request)
-    route_map = service.registry.get_route_map()
+async def handle_capabilities(request: Request) -> Response:
+    """Aggregated capabilities from all connected backends.
 
-    # Query parameters
-    filter_type = request.query_params.get("type")
-    filter_backend = request.query_params.get("backend")
-    filter_search = request.query_params.get("search", "").lower()
+    Supports conditional requests (``ETag`` / ``If-None-Match``).
+    """
+    params = request.query_params
+    resp = _build_capabilities(
+        _get_service(request),
+        filter_type=params.get("type"),
+        filter_backend=params.get("backend"),
+        filter_search=params.get("search", "").lower(),
+    )
+    return _with_etag(request, JSONResponse(resp.model_dump()))
 
-    tools = []
-    resources = []
-    prompts = []
+
+def _build_capabilities(
+    service: ArgusService,
+    *,
+    filter_type: Optional[str] = None,
+    filter_backend: Optional[str] = None,
+    filter_search: str = "",
+) -> CapabilitiesResponse:
+    """Build the ``/capabilities`` payload, applying the optional filters."""
+    route_map = service.registry.get_route_map()
+
+    tools: List[ToolDetail] = []
+    resources: List[ResourceDetail] = []
+    prompts: List[PromptDetail] = []
+    add_tool = tools.append
+    add_resource = resources.append
+    add_prompt = prompts.append
 
     # Tools
     if filter_type is None or filter_type == "tools":
@@ -303,21 +371,20 @@ async def handle_capabilities(request: Request) -> JSONResponse:
             if filter_search and filter_search not in tool.name.lower():
                 continue
 
-            tools.append(
+            add_tool(
                 ToolDetail(
                     name=tool.name,
                     original_name=original_name,
                     description=tool.description or "",
                     backend=backend_name,
-                    input_schema=tool.inputSchema if hasattr(tool, "inputSchema") else {},
+                    input_schema=tool.inputSchema,
                 )
             )
 
     # Resources
     if filter_type is None or filter_type == "resources":
         for resource in service.resources:
-            rname = resource.name if hasattr(resource, "name") else ""
-            ruri = str(resource.uri) if hasattr(resource, "uri") else ""
+            rname = resource.name
             entry = route_map.get(rname)
             backend_name = entry[0] if entry else ""
 
@@ -326,12 +393,12 @@ async def handle_capabilities(request: Request) -> JSONResponse:
             if filter_search and filter_search not in rname.lower():
                 continue
 
-            resources.append(
+            add_resource(
                 ResourceDetail(
-                    uri=ruri,
+                    uri=str(resource.uri),
                     name=rname,
                     backend=backend_name,
-                    mime_type=getattr(resource, "mimeType", None),
+                    mime_type=resource.mimeType,
                 )
             )
 
@@ -346,7 +413,7 @@ async def handle_capabilities(request: Request) -> JSONResponse:
             if filter_search and filter_search not in prompt.name.lower():
                 continue
 
-            prompts.append(
+            add_prompt(
                 PromptDetail(
                     name=prompt.name,
                     description=prompt.description or "",
@@ -355,27 +422,47 @@ async def handle_capabilities(request: Request) -> JSONResponse:
                 )
             )
 
-    resp = CapabilitiesResponse(
+    return CapabilitiesResponse(
         tools=tools,
         resources=resources,
         prompts=prompts,
         route_map=route_map,
     )
-    return JSONResponse(resp.model_dump())
 
 
 # ── GET /manage/v1/events ───────────────────────────────────────────────
 
 
-async def handle_events(request: Request) -> JSONResponse:
+async def handle_events(request: Request) -> Response:
     """Recent events (polling)."""
     service = _get_service(request)
 
-    limit = int(request.query_params.get("limit", "100"))
-    since = request.query_params.get("since")
-    severity = request.query_params.get("severity")
+    params = request.query_params
+    limit = _parse_int(params.get("limit"), 100, 1, _EVENTS_LIMIT_MAX)
+    since = params.get("since")
+    after = params.get("after")
+    severity = params.get("severity")
+    if severity is not None and severity not in _EVENT_SEVERITIES:
+        return _error_json(
+            "bad_request",
+            f"Invalid severity '{severity}'; expected one of: debug, info, warning, error.",
+            400,
+        )
+
+    resp = _build_events(service, limit=limit, since=since, severity=severity, after=after)
+    return JSONResponse(resp.model_dump())
+
 
-    raw_events = service.get_events(limit=limit, since=since, severity=severity)
+def _build_events(
+    service: ArgusService,
+    *,
+    limit: int,
+    since: Optional[str] = None,
+    severity: Optional[str] = None,
+    after: Optional[str] = None,
+) -> EventsResponse:
+    """Build the ``/events`` payload."""
+    raw_events = service.get_events(limit=limit, since=since, severity=severity, after=after)
     items = [
         EventItem(
             id=e["id"],
@@ -388,9 +475,7 @@ async def handle_events(request: Request) -> JSONResponse:
         )
         for e in raw_events
     ]
-
-    resp = EventsResponse(events=items)
-    return JSONResponse(resp.model_dump())
+    return EventsResponse(events=items)
 
 
 # ── GET /manage/v1/events/stream ────────────────────────────────────────
@@ -440,7 +525,7 @@ def _sse_format(
 ) -> str:
     """Format a Server-Sent Event string."""
     parts = [f"event: {event_type}"]
-    parts.append(f"data: {json.dumps(data, default=str)}")
+    parts.append(f"data: {_fastjson.dumps(data, default=str).decode()}")
     if event_id:
         parts.append(f"id: {event_id}")
     parts.append("\n")
@@ -476,8 +561,8 @@ async def handle_reconnect(request: Request) -> JSONResponse:
     if not service.is_running:
         return _error_json("service_unavailable", "Service is not running.", 503)
 
-    # Check if backend exists
-    if service.config_data and name not in service.config_data:
+    # Reject unknown names before reconnect_backend() queues on the reload lock
+    if name not in service.backend_names:
         return _error_json("not_found", f"Backend '{name}' not found.", 404)
 
     result = await service.reconnect_backend(name)
@@ -493,13 +578,20 @@ async def handle_shutdown(request: Request) -> JSONResponse:
     """Graceful server shutdown with backend cleanup."""
     service = _get_service(request)
 
-    # Parse optional timeout from request body
-    timeout = 30
+    # Parse optional timeout from request body; most callers send none.
+    timeout = _SHUTDOWN_TIMEOUT_DEFAULT
+    headers = request.headers
     try:
-        body = await request.json()
-        timeout = int(body.get("timeout_seconds", 30))
-    except Exception:
-        pass  # Use default timeout
+        content_length = int(headers.get("content-length") or 0)
+    except ValueError:
+        content_length = 0
+    if content_length > 0 and headers.get("content-type", "").startswith("application/json"):
+        try:
+            body = await request.json()
+            if isinstance(body, dict):
+                timeout = int(body.get("timeout_seconds", _SHUTDOWN_TIMEOUT_DEFAULT))
+        except (ValueError, TypeError, OverflowError):
+            pass  # Not a finite number; use default timeout
 
     resp = ShutdownResponse(shutting_down=True)
     # Schedule shutdown in background so we can return the response first
@@ -507,12 +599,9 @@ async def handle_shutdown(request: Request) -> JSONResponse:
         _deferred_shutdown(service, timeout),
         name="management_shutdown",
     )
-    # Store strong reference on the event loop to prevent GC
-    loop = asyncio.get_running_loop()
-    if not hasattr(loop, "_argus_bg_tasks"):
-        loop._argus_bg_tasks = set()  # type: ignore[attr-defined]
-    loop._argus_bg_tasks.add(task)  # type: ignore[attr-defined]
-    task.add_done_callback(loop._argus_bg_tasks.discard)  # type: ignore[attr-defined]
+    # Hold a strong reference until the task finishes to prevent GC
+    _BG_TASKS.add(task)
+    task.add_done_callback(_BG_TASKS.discard)
     return JSONResponse(resp.model_dump())
 
 
@@ -522,6 +611,56 @@ async def _deferred_shutdown(service: ArgusService, timeout: int) -> None:
     await service.shutdown(timeout_seconds=timeout)
 
 
+# ── GET /manage/v1/snapshot ─────────────────────────────────────────────
+
+
+async def handle_snapshot(request: Request) -> JSONResponse:
+    """Health, status, backends, capabilities and recent events in one response.
+
+    Lets dashboards refresh with a single round-trip instead of one per
+    endpoint.
+
+    Query parameters:
+        include (str): Comma-separated sections to return (default: all).
+        events_limit (int): Number of recent events to include (default 20).
+        events_after (str): Event-ID cursor; include only newer events.
+    """
+    service = _get_service(request)
+    params = request.query_params
+
+    include_param = params.get("include")
+    if include_param is None:
+        include = frozenset(_SNAPSHOT_SECTIONS)
+    else:
+        include = frozenset(part.strip() for part in include_param.split(",") if part.strip())
+        unknown = include.difference(_SNAPSHOT_SECTIONS)
+        if unknown:
+            return _error_json(
+                "bad_request",
+                f"Unknown snapshot section(s): {', '.join(sorted(unknown))}; "
+                f"expected any of: {', '.join(_SNAPSHOT_SECTIONS)}.",
+                400,
+            )
+    events_limit = _parse_int(params.get("events_limit"), 20, 0, _EVENTS_LIMIT_MAX)
+
+    resp = SnapshotResponse()
+    if "health" in include:
+        resp.health = _build_health(service)
+    if "status" in include:
+        resp.status = _build_status(request, service)
+    if "backends" in include:
+        resp.backends = _build_backends(service)
+    if "capabilities" in include:
+        resp.capabilities = _build_capabilities(service)
+    if "events" in include:
+        resp.events = (
+            _build_events(service, limit=events_limit, after=params.get("events_after"))
+            if events_limit
+            else EventsResponse()
+        )
+    return JSONResponse(resp.model_dump())
+
+
 # ── GET /manage/v1/sessions ─────────────────────────────────────────────
 
 
@@ -553,6 +692,7 @@ management_routes = Router(
         Route("/groups", endpoint=handle_groups, methods=["GET"]),
         Route("/capabilities", endpoint=handle_capabilities, methods=["GET"]),
         Route("/sessions", endpoint=handle_sessions, methods=["GET"]),
+        Route("/snapshot", endpoint=handle_snapshot, methods=["GET"]),
         Route("/events", endpoint=handle_events, methods=["GET"]),
         Route("/events/stream", endpoint=handle_events_stream, methods=["GET"]),
         Route("/reload", endpoint=handle_reload, methods=["POST"]),
@@ -139,6 +139,18 @@ class EventsResponse(BaseModel):
     events: List[EventItem] = Field(default_factory=list)
 
 
+# ── /manage/v1/snapshot ─────────────────────────────────────────────────
+
+
+class SnapshotResponse(BaseModel):
+    # Sections left out via ``?include=`` are null
+    health: Optional[HealthResponse] = None
+    status: Optional[StatusResponse] = None
+    backends: Optional[BackendsResponse] = None
+    capabilities: Optional[CapabilitiesResponse] = None
+    events: Optional[EventsResponse] = None
+
+
 # ── Error responses ──────────────────────────────────────────────────────
 
 
@@ -8,7 +8,7 @@ from typing import Any, Dict, Optional
 from uuid import uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPSession:
     """Represents a per-client MCP session with frozen routing.
 
@@ -64,14 +64,20 @@ class MCPSession:
         return self.routing_table.get(tool_name)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialise the session for the management API."""
+        """Serialise the session for the management API.
+
+        Reads the clock once so age, idle time and expiry are computed
+        from the same instant.
+        """
+        now = monotonic()
+        idle = now - self.last_active
         return {
             "id": self.id,
             "transport_type": self.transport_type,
             "tool_count": len(self.routing_table),
             "capability_snapshot": self.capability_snapshot,
-            "age_seconds": round(self.age_seconds, 1),
-            "idle_seconds": round(self.idle_seconds, 1),
+            "age_seconds": round(now - self.created_at, 1),
+            "idle_seconds": round(idle, 1),
             "ttl": self.ttl,
-            "expired": self.expired,
+            "expired": idle > self.ttl,
         }
@@ -8,15 +8,18 @@ instances and ``argus-mcp stop <name>`` can target a specific one.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
-import re
+import select
 import signal
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from argus_mcp import _fastjson
+from argus_mcp._fileio import write_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +31,14 @@ _SESSION_DIR = os.path.join(
     "sessions",
 )
 
-_NAME_RE = re.compile(r"^[a-z0-9][a-z0-9\-]{0,31}$")
+# Session names: lowercase alphanumeric + hyphens, 1–32 chars, not starting with "-"
+_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+_NAME_MAX_LEN = 32
+
+# Parsed session files keyed by path: (st_mtime_ns, st_size, SessionInfo).
+# Entries are reused while the file's mtime and size are unchanged; callers
+# always get a copy, so mutating a returned SessionInfo cannot leak back.
+_SESSION_CACHE: Dict[str, Tuple[int, int, SessionInfo]] = {}
 
 
 # ── Data ─────────────────────────────────────────────────────────────────
@@ -46,6 +56,18 @@ class SessionInfo:
     log_file: str = ""
     started_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a plain dict (all values are JSON-native)."""
+        return {
+            "name": self.name,
+            "pid": self.pid,
+            "host": self.host,
+            "port": self.port,
+            "config": self.config,
+            "log_file": self.log_file,
+            "started_at": self.started_at,
+        }
+
     def is_alive(self) -> bool:
         """Return *True* if the process is still running."""
         try:
@@ -66,7 +88,7 @@ def validate_name(name: str) -> str:
     Raises ``ValueError`` if the name is invalid.
     """
     name = name.lower().strip()
-    if not _NAME_RE.match(name):
+    if not (0 < len(name) <= _NAME_MAX_LEN and name[0] != "-" and _NAME_CHARS.issuperset(name)):
         raise ValueError(
             f"Invalid session name '{name}'. "
             "Use lowercase alphanumeric + hyphens, 1–32 chars, "
@@ -95,8 +117,8 @@ def save_session(info: SessionInfo) -> str:
     """Write session metadata to disk.  Returns the file path."""
     os.makedirs(_SESSION_DIR, exist_ok=True)
     path = session_path(info.name)
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(asdict(info), fh, indent=2)
+    _SESSION_CACHE.pop(path, None)
+    write_atomic(path, _fastjson.dumps(info.to_dict(), indent=True))
     logger.debug("Session '%s' saved to %s", info.name, path)
     return path
 
@@ -105,19 +127,37 @@ def load_session(name: str) -> Optional[SessionInfo]:
     """Load session metadata from disk, or ``None`` if missing/corrupt."""
     path = session_path(name)
     try:
-        with open(path, encoding="utf-8") as fh:
-            data = json.load(fh)
-        return SessionInfo(**data)
+        st = os.stat(path)
     except FileNotFoundError:
+        _SESSION_CACHE.pop(path, None)
+        return None
+    return _load_session_file(path, st)
+
+
+def _load_session_file(path: str, st: os.stat_result) -> Optional[SessionInfo]:
+    """Parse *path*, reusing the cached result while its mtime and size match."""
+    cached = _SESSION_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return replace(cached[2])
+    try:
+        with open(path, "rb") as fh:
+            data = _fastjson.loads(fh.read())
+        info = SessionInfo(**data)
+    except FileNotFoundError:
+        _SESSION_CACHE.pop(path, None)
         return None
     except Exception:
+        _SESSION_CACHE.pop(path, None)
         logger.warning("Corrupt session file %s", path, exc_info=True)
         return None
+    _SESSION_CACHE[path] = (st.st_mtime_ns, st.st_size, info)
+    return replace(info)
 
 
 def remove_session(name: str) -> None:
     """Delete the session metadata file."""
     path = session_path(name)
+    _SESSION_CACHE.pop(path, None)
     try:
         os.unlink(path)
         logger.debug("Session file removed: %s", path)
@@ -125,6 +165,18 @@ def remove_session(name: str) -> None:
         pass
 
 
+def _live_pids() -> Optional[FrozenSet[int]]:
+    """Return the PIDs listed in ``/proc``, or ``None`` where it is unavailable.
+
+    One directory read replaces a ``kill(pid, 0)`` probe per session.
+    """
+    try:
+        names = os.listdir("/proc")
+    except OSError:
+        return None
+    return frozenset(int(n) for n in names if n.isdigit())
+
+
 def list_sessions(*, include_dead: bool = False) -> List[SessionInfo]:
     """List all saved sessions, optionally filtering out dead ones.
 
@@ -134,16 +186,25 @@ def list_sessions(*, include_dead: bool = False) -> List[SessionInfo]:
     if not os.path.isdir(_SESSION_DIR):
         return []
 
+    with os.scandir(_SESSION_DIR) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".json") and e.is_file()),
+            key=lambda e: e.name,
+        )
+
+    live_pids = _live_pids()
     sessions: List[SessionInfo] = []
-    for fname in sorted(os.listdir(_SESSION_DIR)):
-        if not fname.endswith(".json"):
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except FileNotFoundError:
             continue
-        name = fname[:-5]
-        info = load_session(name)
+        info = _load_session_file(entry.path, st)
         if info is None:
             continue
 
-        if info.is_alive():
+        alive = info.pid in live_pids if live_pids is not None else info.is_alive()
+        if alive:
             sessions.append(info)
         elif include_dead:
             sessions.append(info)
@@ -192,31 +253,159 @@ def stop_session(
         remove_session(info.name)
         return True
 
-    sig = signal.SIGKILL if force else signal.SIGTERM
+    # Hold a pidfd for the whole stop sequence so neither signal can reach
+    # an unrelated process that reused the PID after ours exited.
     try:
-        os.kill(info.pid, sig)
-    except OSError as exc:
-        logger.error("Failed to signal PID %d: %s", info.pid, exc)
-        return False
+        pidfd = _pidfd_open(info.pid)
+    except ProcessLookupError:
+        remove_session(info.name)
+        return True
 
-    # Wait for exit
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        if not info.is_alive():
+    try:
+        sig = signal.SIGKILL if force else signal.SIGTERM
+        try:
+            _send_signal(info.pid, pidfd, sig)
+        except ProcessLookupError:
+            pass  # exited in the meantime
+        except OSError as exc:
+            logger.error("Failed to signal PID %d: %s", info.pid, exc)
+            return False
+
+        if _wait_for_exit(info, timeout, pidfd):
             remove_session(info.name)
             return True
-        time.sleep(0.1)
 
-    # Escalate to SIGKILL
-    if not force:
+        # Escalate to SIGKILL
+        if not force:
+            try:
+                _send_signal(info.pid, pidfd, signal.SIGKILL)
+            except OSError:
+                pass
+
+        stopped = _wait_for_exit(info, 0.2, pidfd)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+    remove_session(info.name)
+    return stopped
+
+
+async def stop_session_async(
+    info: SessionInfo,
+    *,
+    timeout: float = 3.0,
+    force: bool = False,
+) -> bool:
+    """Awaitable :func:`stop_session` that does not block the event loop.
+
+    The pidfd is registered with the running loop, which resumes this
+    coroutine as soon as the process exits.  Without pidfd support the
+    blocking :func:`stop_session` runs in a worker thread instead.
+    """
+    if not info.is_alive():
+        remove_session(info.name)
+        return True
+
+    try:
+        pidfd = _pidfd_open(info.pid)
+    except ProcessLookupError:
+        remove_session(info.name)
+        return True
+    if pidfd is None:
+        return await asyncio.to_thread(stop_session, info, timeout=timeout, force=force)
+
+    try:
+        sig = signal.SIGKILL if force else signal.SIGTERM
         try:
-            os.kill(info.pid, signal.SIGKILL)
-        except OSError:
-            pass
-        time.sleep(0.2)
+            _send_signal(info.pid, pidfd, sig)
+        except ProcessLookupError:
+            pass  # exited in the meantime
+        except OSError as exc:
+            logger.error("Failed to signal PID %d: %s", info.pid, exc)
+            return False
+
+        if await _wait_for_pidfd_async(pidfd, timeout):
+            remove_session(info.name)
+            return True
+
+        # Escalate to SIGKILL
+        if not force:
+            try:
+                _send_signal(info.pid, pidfd, signal.SIGKILL)
+            except OSError:
+                pass
+
+        stopped = await _wait_for_pidfd_async(pidfd, 0.2)
+    finally:
+        os.close(pidfd)
 
     remove_session(info.name)
-    return not info.is_alive()
+    return stopped
+
+
+async def _wait_for_pidfd_async(pidfd: int, timeout: float) -> bool:
+    """Wait up to *timeout* seconds for *pidfd* to become readable (process exit)."""
+    loop = asyncio.get_running_loop()
+    exited = loop.create_future()
+
+    def _on_readable() -> None:
+        if not exited.done():
+            exited.set_result(None)
+
+    loop.add_reader(pidfd, _on_readable)
+    try:
+        await asyncio.wait_for(exited, timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        loop.remove_reader(pidfd)
+
+
+def _pidfd_open(pid: int) -> Optional[int]:
+    """Return a pidfd for *pid*, or ``None`` where pidfds are unsupported.
+
+    Raises ``ProcessLookupError`` if the process no longer exists.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except ProcessLookupError:
+        raise
+    except OSError:
+        return None  # e.g. kernel < 5.3
+
+
+def _send_signal(pid: int, pidfd: Optional[int], sig: int) -> None:
+    """Deliver *sig* through *pidfd* when available, else by PID."""
+    if pidfd is not None:
+        signal.pidfd_send_signal(pidfd, sig)
+    else:
+        os.kill(pid, sig)
+
+
+def _wait_for_exit(info: SessionInfo, timeout: float, pidfd: Optional[int]) -> bool:
+    """Wait up to *timeout* seconds for the session process to exit.
+
+    A pidfd becomes readable when the process exits, so a single ``poll``
+    replaces repeated ``kill(pid, 0)`` probes.  Without one (non-Linux or
+    old kernels) this falls back to polling :meth:`SessionInfo.is_alive`.
+    """
+    if pidfd is not None:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        return bool(poller.poll(timeout * 1000))
+
+    deadline = time.monotonic() + timeout
+    while True:
+        if not info.is_alive():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.1)
 
 
 def check_port_conflict(host: str, port: int) -> Optional[SessionInfo]:
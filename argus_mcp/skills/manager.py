@@ -6,19 +6,33 @@ namespacing for skill packages.
 
 from __future__ import annotations
 
-import json
+import contextlib
 import logging
 import os
 import shutil
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+from argus_mcp import _fastjson
+from argus_mcp._fileio import write_atomic
 from argus_mcp.skills.manifest import SkillManifest, SkillManifestError
 
 logger = logging.getLogger(__name__)
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """``copytree`` copy function: hard-link *src* to *dst*, copying across filesystems."""
+    # Replace rather than write through an existing file, which may itself
+    # be a hard link back to another skill's source.
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 class SkillStatus(Enum):
     """Status of an installed skill."""
 
@@ -33,6 +47,16 @@ class InstalledSkill:
     manifest: SkillManifest
     status: SkillStatus = SkillStatus.ENABLED
     install_path: str = ""
+    # Called after ``status`` is reassigned; the manager uses it to
+    # invalidate its tool and workflow caches
+    on_status_change: Optional[Callable[[], None]] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "status":
+            callback = self.__dict__.get("on_status_change")
+            if callback is not None:
+                callback()
 
     @property
     def name(self) -> str:
@@ -61,31 +85,75 @@ class SkillManager:
         self._skills_dir = skills_dir
         self._state_file = os.path.join(skills_dir, "skills-state.json")
         self._skills: Dict[str, InstalledSkill] = {}
+        # Last state written by _save_state; an identical state skips the write
+        self._last_state: Optional[Dict[str, str]] = None
+        # Parsed manifests keyed by path: (st_mtime_ns, manifest)
+        self._manifest_cache: Dict[str, Tuple[int, SkillManifest]] = {}
+        # Nesting depth of batch(); _save_state is deferred while > 0
+        self._batch_depth = 0
+        self._dirty = False
+        # Bumped whenever the installed set or a status changes; keys the
+        # get_all_tools()/get_all_workflows() caches below
+        self._version = 0
+        self._tools_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+        self._workflows_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+
+    def _bump_version(self) -> None:
+        self._version += 1
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer state-file writes until the outermost ``with`` block exits.
+
+        Use around several install/uninstall/enable/disable calls so the
+        state file is written once instead of once per call.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save_state()
 
     def discover(self) -> List[InstalledSkill]:
         """Scan the skills directory and load all manifests."""
         self._skills.clear()
+        self._version += 1
 
         if not os.path.isdir(self._skills_dir):
             return []
 
         state = self._load_state()
 
-        for entry in sorted(os.listdir(self._skills_dir)):
-            skill_path = os.path.join(self._skills_dir, entry)
+        # DirEntry.is_dir() reuses the type from the directory read, so plain
+        # files (e.g. the state file) are skipped without an extra stat.
+        with os.scandir(self._skills_dir) as it:
+            skill_paths = sorted(e.path for e in it if e.is_dir())
+
+        for skill_path in skill_paths:
             manifest_path = os.path.join(skill_path, "manifest.json")
 
-            if not os.path.isfile(manifest_path):
+            try:
+                mtime_ns = os.stat(manifest_path).st_mtime_ns
+            except OSError:
+                self._manifest_cache.pop(manifest_path, None)
                 continue
 
             try:
-                manifest = SkillManifest.from_file(manifest_path)
+                cached = self._manifest_cache.get(manifest_path)
+                if cached is not None and cached[0] == mtime_ns:
+                    manifest = cached[1]
+                else:
+                    manifest = SkillManifest.from_file(manifest_path)
+                    self._manifest_cache[manifest_path] = (mtime_ns, manifest)
                 status_str = state.get(manifest.name, "enabled")
                 status = SkillStatus.DISABLED if status_str == "disabled" else SkillStatus.ENABLED
                 skill = InstalledSkill(
                     manifest=manifest,
                     status=status,
                     install_path=skill_path,
+                    on_status_change=self._bump_version,
                 )
                 self._skills[manifest.name] = skill
             except SkillManifestError as exc:
@@ -94,10 +162,13 @@ class SkillManager:
         logger.info("Discovered %d skill(s)", len(self._skills))
         return list(self._skills.values())
 
-    def install(self, source_path: str) -> InstalledSkill:
+    def install(self, source_path: str, *, move: bool = False) -> InstalledSkill:
         """Install a skill from a directory path.
 
         Copies the skill directory into ``skills_dir`` and loads the manifest.
+        With *move* the caller gives up *source_path*: it is renamed into
+        place when possible (same filesystem, no existing install), and
+        otherwise its files are hard-linked rather than copied.
         """
         manifest_path = os.path.join(source_path, "manifest.json")
         if not os.path.isfile(manifest_path):
@@ -119,18 +190,32 @@ class SkillManager:
                     dep,
                 )
 
-        # Copy to skills directory
+        # Copy (or move) to skills directory
         dest = os.path.join(self._skills_dir, manifest.name)
-        os.makedirs(dest, exist_ok=True)
+        self._manifest_cache.pop(os.path.join(dest, "manifest.json"), None)
+        os.makedirs(self._skills_dir, exist_ok=True)
         if os.path.abspath(source_path) != os.path.abspath(dest):
-            shutil.copytree(source_path, dest, dirs_exist_ok=True)
+            moved = False
+            if move and not os.path.exists(dest):
+                try:
+                    os.rename(source_path, dest)
+                    moved = True
+                except OSError:
+                    pass  # e.g. different filesystem; fall back to copying
+            if not moved:
+                copy_function = _link_or_copy if move else shutil.copy2
+                shutil.copytree(source_path, dest, dirs_exist_ok=True, copy_function=copy_function)
+        else:
+            os.makedirs(dest, exist_ok=True)
 
         skill = InstalledSkill(
             manifest=manifest,
             status=SkillStatus.ENABLED,
             install_path=dest,
+            on_status_change=self._bump_version,
         )
         self._skills[manifest.name] = skill
+        self._version += 1
         self._save_state()
 
         logger.info("Skill '%s' v%s installed", manifest.name, manifest.version)
@@ -149,8 +234,10 @@ class SkillManager:
             if not real_path.startswith(real_base + os.sep):
                 raise ValueError(f"Refusing to remove '{real_path}': not within skills directory")
             shutil.rmtree(skill.install_path)
+            self._manifest_cache.pop(os.path.join(skill.install_path, "manifest.json"), None)
 
         del self._skills[skill_name]
+        self._version += 1
         self._save_state()
         logger.info("Skill '%s' uninstalled", skill_name)
 
@@ -192,7 +279,14 @@ class SkillManager:
         return dict(skill.manifest.config)
 
     def get_all_tools(self) -> List[Dict[str, Any]]:
-        """Get tool definitions from all enabled skills."""
+        """Get tool definitions from all enabled skills.
+
+        The namespaced copies are cached until the next install, uninstall,
+        status change or discover; each call returns new dicts.
+        """
+        cached = self._tools_cache
+        if cached is not None and cached[0] == self._version:
+            return [dict(t) for t in cached[1]]
         tools: List[Dict[str, Any]] = []
         for skill in self.list_enabled():
             for tool in skill.manifest.tools:
@@ -201,31 +295,43 @@ class SkillManager:
                 if "name" in tool_copy:
                     tool_copy["_skill"] = skill.name
                 tools.append(tool_copy)
-        return tools
+        self._tools_cache = (self._version, tools)
+        return [dict(t) for t in tools]
 
     def get_all_workflows(self) -> List[Dict[str, Any]]:
-        """Get workflow definitions from all enabled skills."""
+        """Get workflow definitions from all enabled skills (cached like :meth:`get_all_tools`)."""
+        cached = self._workflows_cache
+        if cached is not None and cached[0] == self._version:
+            return [dict(wf) for wf in cached[1]]
         workflows: List[Dict[str, Any]] = []
         for skill in self.list_enabled():
             for wf in skill.manifest.workflows:
                 wf_copy = dict(wf)
                 wf_copy["_skill"] = skill.name
                 workflows.append(wf_copy)
-        return workflows
+        self._workflows_cache = (self._version, workflows)
+        return [dict(wf) for wf in workflows]
 
     def _load_state(self) -> Dict[str, str]:
         """Load skill state from the state file."""
         if not os.path.isfile(self._state_file):
             return {}
         try:
-            with open(self._state_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(self._state_file, "rb") as f:
+                return _fastjson.loads(f.read())
         except Exception:
             return {}
 
     def _save_state(self) -> None:
         """Persist skill state to the state file."""
+        if self._batch_depth > 0:
+            self._dirty = True
+            return
+        self._dirty = False
         state = {name: skill.status.value for name, skill in self._skills.items()}
+        if state == self._last_state and os.path.isfile(self._state_file):
+            return
+        payload = _fastjson.dumps(state, indent=True)
         os.makedirs(self._skills_dir, exist_ok=True)
-        with open(self._state_file, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        write_atomic(self._state_file, payload)
+        self._last_state = state
@@ -7,8 +7,7 @@ OTel is not installed.
 from __future__ import annotations
 
 import logging
-from contextlib import contextmanager
-from typing import Any, Generator, Optional
+from typing import Any, ContextManager, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -25,26 +24,24 @@ _TRACER_NAME = "argus_mcp"
 def get_tracer() -> Any:
     """Return the Argus MCP tracer (or a no-op proxy)."""
     if not _HAS_OTEL:
-        return _NoOpTracer()
+        return _NOOP_TRACER
     return trace.get_tracer(_TRACER_NAME)
 
 
-@contextmanager
 def start_span(
     name: str,
     attributes: Optional[dict] = None,
-) -> Generator[Any, None, None]:
+) -> ContextManager[Any]:
     """Context manager that starts a trace span.
 
-    When OTel is not installed, yields a no-op span.
+    When OTel is not installed, returns a shared no-op span, which is its
+    own context manager, so the hot path allocates nothing.
     """
     if not _HAS_OTEL:
-        yield _NoOpSpan()
-        return
+        return _NOOP_SPAN
 
     tracer = trace.get_tracer(_TRACER_NAME)
-    with tracer.start_as_current_span(name, attributes=attributes or {}) as span:
-        yield span
+    return tracer.start_as_current_span(name, attributes=attributes or {})
 
 
 # ── No-op fallbacks ─────────────────────────────────────────────────────
@@ -53,6 +50,14 @@ def start_span(
 class _NoOpSpan:
     """Dummy span when OTel is not installed."""
 
+    __slots__ = ()
+
+    def __enter__(self) -> _NoOpSpan:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
     def set_attribute(self, key: str, value: Any) -> None:
         pass
 
@@ -69,6 +74,11 @@ class _NoOpSpan:
 class _NoOpTracer:
     """Dummy tracer when OTel is not installed."""
 
-    @contextmanager
-    def start_as_current_span(self, name: str, **kwargs: Any) -> Generator[_NoOpSpan, None, None]:
-        yield _NoOpSpan()
+    __slots__ = ()
+
+    def start_as_current_span(self, name: str, **kwargs: Any) -> _NoOpSpan:
+        return _NOOP_SPAN
+
+
+_NOOP_SPAN = _NoOpSpan()
+_NOOP_TRACER = _NoOpTracer()
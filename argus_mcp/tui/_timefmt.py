@@ -0,0 +1,16 @@
+"""Timestamp formatting shared by TUI tables."""
+
+from __future__ import annotations
+
+
+def hms(ts: str) -> str:
+    """Return the ``HH:MM:SS`` part of an ISO-8601 timestamp.
+
+    Strings without a ``T`` separator are returned unchanged.
+    """
+    if len(ts) >= 19 and ts[10] == "T":
+        return ts[11:19]  # ISO-8601: HH:MM:SS at a fixed offset
+    t = ts.find("T")
+    if t >= 0:
+        return ts[t + 1 : t + 9]
+    return ts
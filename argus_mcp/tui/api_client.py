@@ -7,30 +7,90 @@ hosting one in-process.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
 
 import httpx
+from pydantic import BaseModel
 
 from argus_mcp.server.management.schemas import (
     BackendsResponse,
     CapabilitiesResponse,
+    EventItem,
     EventsResponse,
     HealthResponse,
     ReconnectResponse,
     ReloadResponse,
     ShutdownResponse,
+    SnapshotResponse,
     StatusResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
 # Default timeout for regular API calls (seconds).
 _DEFAULT_TIMEOUT = 10.0
 
 # Timeout for mutating operations that may take longer.
 _MUTATING_TIMEOUT = 30.0
 
+# Read timeout for the SSE event stream.  The server sends a heartbeat every
+# 30 s, so a silent connection this long is treated as dead.
+_STREAM_READ_TIMEOUT = 75.0
+
+# Connection pool shared by every ApiClient in the process, so polling
+# several servers (or reconnecting to one) reuses keep-alive sockets.
+# The expiry comfortably exceeds the TUI poll interval so idle sockets survive
+# between ticks.
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0)
+
+_shared_client: Optional[httpx.AsyncClient] = None
+# Event loop the shared client was created on; its pooled connections are
+# bound to that loop and must not be reused from another one.
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Fixed endpoint paths under /manage/v1/, resolved to absolute URLs once per client
+_ENDPOINTS = (
+    "health",
+    "status",
+    "backends",
+    "capabilities",
+    "events",
+    "events/stream",
+    "snapshot",
+    "reload",
+    "shutdown",
+)
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide ``httpx.AsyncClient``, creating it on first use.
+
+    Must be called from a running event loop.  A client created on a
+    different (e.g. already finished) loop is replaced rather than reused.
+    """
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            timeout=_DEFAULT_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(retries=1, limits=_POOL_LIMITS),
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the process-wide ``httpx.AsyncClient`` and its pooled connections."""
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+        _shared_client_loop = None
+
 
 class ApiClientError(Exception):
     """Raised when the management API returns an unexpected status."""
@@ -52,115 +112,244 @@ class ApiClient:
         Optional bearer token for authenticated endpoints.
     """
 
+    __slots__ = (
+        "_base_url",
+        "_api_url",
+        "_urls",
+        "_token",
+        "_headers",
+        "_client",
+        "_connected",
+        "_validated",
+    )
+
     def __init__(self, base_url: str, token: Optional[str] = None) -> None:
         self._base_url = base_url.rstrip("/")
         self._api_url = f"{self._base_url}/manage/v1/"
+        self._urls: Dict[str, httpx.URL] = {
+            name: httpx.URL(self._api_url + name) for name in _ENDPOINTS
+        }
         self._token = token
+        self._headers = httpx.Headers()
         self._client: Optional[httpx.AsyncClient] = None
+        self._connected = False
+        # endpoint → (ETag, parsed model) for conditional GETs
+        self._validated: Dict[str, Tuple[str, BaseModel]] = {}
 
     # ── Lifecycle ────────────────────────────────────────────────
 
     async def connect(self) -> None:
-        """Create the underlying ``httpx.AsyncClient``."""
+        """Attach to the shared ``httpx.AsyncClient`` connection pool."""
         headers: dict[str, str] = {"Accept": "application/json"}
         if self._token:
             headers["Authorization"] = f"Bearer {self._token}"
 
-        self._client = httpx.AsyncClient(
-            base_url=self._api_url,
-            headers=headers,
-            timeout=_DEFAULT_TIMEOUT,
-        )
+        self._headers = httpx.Headers(headers)
+        self._client = _get_shared_client()
+        self._connected = True
         logger.info("ApiClient connected to %s", self._api_url)
 
     async def close(self) -> None:
-        """Shut down the HTTP client gracefully."""
+        """Detach from the shared pool (see :func:`close_shared_client`)."""
         if self._client is not None:
-            await self._client.aclose()
             self._client = None
+            self._connected = False
             logger.info("ApiClient closed")
 
     @property
     def is_connected(self) -> bool:
-        """Return *True* if the underlying client is open."""
-        return self._client is not None and not self._client.is_closed
+        """Return *True* if :meth:`connect` was called and the shared pool is open."""
+        return self._connected and not self._client.is_closed  # type: ignore[union-attr]
+
+    async def warm(self, connections: int = 1) -> None:
+        """Open up to *connections* pooled sockets to the server ahead of use.
+
+        Issues that many concurrent ``HEAD /manage/v1/health`` requests so
+        the first real reads skip connection setup.  Failures are ignored;
+        they surface on the first real request instead.
+        """
+        client = self._ensure_client()
+        url = self._urls["health"]
+        await asyncio.gather(
+            *(client.head(url, headers=self._headers) for _ in range(connections)),
+            return_exceptions=True,
+        )
 
     # ── Private helpers ──────────────────────────────────────────
 
     def _ensure_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
+        # A plain flag check; a pool closed underneath us still fails in httpx.
+        if not self._connected:
             raise RuntimeError("ApiClient is not connected — call connect() first")
-        return self._client
+        return self._client  # type: ignore[return-value]
+
+    async def _conditional_get(self, endpoint: str, model: Type[_ModelT]) -> _ModelT:
+        """GET *endpoint*, revalidating the last response via ``If-None-Match``.
+
+        On ``304 Not Modified`` the previously parsed model instance is
+        returned as-is, so callers can skip work with an identity check.
+        """
+        client = self._ensure_client()
+        cached = self._validated.get(endpoint)
+        headers = self._headers
+        if cached is not None:
+            headers = httpx.Headers(headers)
+            headers["If-None-Match"] = cached[0]
+        resp = await client.get(self._urls[endpoint], headers=headers)
+        if resp.status_code == 304 and cached is not None:
+            return cached[1]  # type: ignore[return-value]
+        resp.raise_for_status()
+        result = model.model_validate_json(resp.content)
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._validated[endpoint] = (etag, result)
+        else:
+            self._validated.pop(endpoint, None)
+        return result
 
     # ── Read-only endpoints ──────────────────────────────────────
 
     async def get_health(self) -> HealthResponse:
         """``GET /manage/v1/health``"""
         client = self._ensure_client()
-        resp = await client.get("health")
+        resp = await client.get(self._urls["health"], headers=self._headers)
         resp.raise_for_status()
-        return HealthResponse.model_validate(resp.json())
+        return HealthResponse.model_validate_json(resp.content)
 
     async def get_status(self) -> StatusResponse:
         """``GET /manage/v1/status``"""
         client = self._ensure_client()
-        resp = await client.get("status")
+        resp = await client.get(self._urls["status"], headers=self._headers)
         resp.raise_for_status()
-        return StatusResponse.model_validate(resp.json())
+        return StatusResponse.model_validate_json(resp.content)
 
     async def get_backends(self) -> BackendsResponse:
         """``GET /manage/v1/backends``"""
         client = self._ensure_client()
-        resp = await client.get("backends")
+        resp = await client.get(self._urls["backends"], headers=self._headers)
         resp.raise_for_status()
-        return BackendsResponse.model_validate(resp.json())
+        return BackendsResponse.model_validate_json(resp.content)
 
     async def get_capabilities(self) -> CapabilitiesResponse:
-        """``GET /manage/v1/capabilities``"""
-        client = self._ensure_client()
-        resp = await client.get("capabilities")
-        resp.raise_for_status()
-        return CapabilitiesResponse.model_validate(resp.json())
+        """``GET /manage/v1/capabilities`` (conditional; may return the cached instance)"""
+        return await self._conditional_get("capabilities", CapabilitiesResponse)
 
-    async def get_events(self, limit: int = 50) -> EventsResponse:
+    async def get_events(self, limit: int = 50, after: Optional[str] = None) -> EventsResponse:
         """``GET /manage/v1/events``
 
         Parameters
         ----------
         limit:
             Maximum number of recent events to retrieve.
+        after:
+            Event-ID cursor; only events newer than this one are returned.
+        """
+        client = self._ensure_client()
+        params: Dict[str, Any] = {"limit": limit}
+        if after is not None:
+            params["after"] = after
+        resp = await client.get(self._urls["events"], params=params, headers=self._headers)
+        resp.raise_for_status()
+        return EventsResponse.model_validate_json(resp.content)
+
+    async def get_snapshot(
+        self,
+        include: Optional[Iterable[str]] = None,
+        events_limit: int = 20,
+        events_after: Optional[str] = None,
+    ) -> SnapshotResponse:
+        """``GET /manage/v1/snapshot``
+
+        Health, status, backends, capabilities and recent events in a
+        single request.
+
+        Parameters
+        ----------
+        include:
+            Sections to return (``health``, ``status``, ``backends``,
+            ``capabilities``, ``events``); all when ``None``.  Omitted
+            sections are ``None`` on the response.
+        events_limit:
+            Maximum number of recent events to include.
+        events_after:
+            Event-ID cursor; only events newer than this one are included.
         """
         client = self._ensure_client()
-        resp = await client.get("events", params={"limit": limit})
+        params: Dict[str, Any] = {"events_limit": events_limit}
+        if include is not None:
+            params["include"] = ",".join(include)
+        if events_after is not None:
+            params["events_after"] = events_after
+        resp = await client.get(self._urls["snapshot"], params=params, headers=self._headers)
         resp.raise_for_status()
-        return EventsResponse.model_validate(resp.json())
+        return SnapshotResponse.model_validate_json(resp.content)
+
+    async def stream_events(self) -> AsyncIterator[EventItem]:
+        """``GET /manage/v1/events/stream``
+
+        Yield events as the server pushes them over Server-Sent Events.
+        Heartbeat frames are consumed silently.  The iterator ends when the
+        server closes the stream; HTTP errors (e.g. 404 from servers without
+        the endpoint) raise :class:`httpx.HTTPStatusError`.
+        """
+        client = self._ensure_client()
+        timeout = httpx.Timeout(_DEFAULT_TIMEOUT, read=_STREAM_READ_TIMEOUT)
+        headers = httpx.Headers(self._headers)
+        headers["Accept"] = "text/event-stream"
+        async with client.stream(
+            "GET", self._urls["events/stream"], headers=headers, timeout=timeout
+        ) as resp:
+            resp.raise_for_status()
+            event_type = ""
+            data_lines: List[str] = []
+            async for line in resp.aiter_lines():
+                if not line:
+                    # Blank line terminates a frame
+                    if data_lines and event_type != "heartbeat":
+                        yield EventItem.model_validate_json("\n".join(data_lines))
+                    event_type = ""
+                    data_lines = []
+                elif line.startswith(":"):
+                    continue  # comment
+                else:
+                    field, _, value = line.partition(":")
+                    if value.startswith(" "):
+                        value = value[1:]
+                    if field == "event":
+                        event_type = value
+                    elif field == "data":
+                        data_lines.append(value)
 
     # ── Mutating endpoints ───────────────────────────────────────
 
     async def post_reload(self) -> ReloadResponse:
         """``POST /manage/v1/reload``"""
         client = self._ensure_client()
-        resp = await client.post("reload", timeout=_MUTATING_TIMEOUT)
+        resp = await client.post(
+            self._urls["reload"], headers=self._headers, timeout=_MUTATING_TIMEOUT
+        )
         resp.raise_for_status()
-        return ReloadResponse.model_validate(resp.json())
+        return ReloadResponse.model_validate_json(resp.content)
 
     async def post_reconnect(self, backend_name: str) -> ReconnectResponse:
         """``POST /manage/v1/reconnect/{name}``"""
         client = self._ensure_client()
         resp = await client.post(
-            f"reconnect/{backend_name}",
+            f"{self._api_url}reconnect/{backend_name}",
+            headers=self._headers,
             timeout=_MUTATING_TIMEOUT,
         )
         resp.raise_for_status()
-        return ReconnectResponse.model_validate(resp.json())
+        return ReconnectResponse.model_validate_json(resp.content)
 
     async def post_shutdown(self, timeout_seconds: float = 5.0) -> ShutdownResponse:
         """``POST /manage/v1/shutdown``"""
         client = self._ensure_client()
         resp = await client.post(
-            "shutdown",
+            self._urls["shutdown"],
             json={"timeout_seconds": timeout_seconds},
+            headers=self._headers,
             timeout=_MUTATING_TIMEOUT,
         )
         resp.raise_for_status()
-        return ShutdownResponse.model_validate(resp.json())
+        return ShutdownResponse.model_validate_json(resp.content)
@@ -6,18 +6,34 @@ HTTP via :class:`ServerManager`.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Iterable, Optional, Set
+import re
+import time
+from collections import deque
+from functools import partial
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar
 
+import httpx
 from textual.app import App, ComposeResult, SystemCommand
 from textual.binding import Binding
 from textual.screen import Screen
-from textual.widgets import Footer, Header
+from textual.timer import Timer
+from textual.widget import Widget
+from textual.widgets import Footer, Header, TabbedContent
+from textual.worker import Worker
 
 from argus_mcp.constants import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
     SERVER_NAME,
     SERVER_VERSION,
 )
+from argus_mcp.registry.cache import RegistryCache
+from argus_mcp.registry.client import RegistryClient
+from argus_mcp.registry.models import ServerEntry
+from argus_mcp.server.management.schemas import BackendDetail, EventsResponse
+from argus_mcp.tui.api_client import close_shared_client
 from argus_mcp.tui.events import (
     CapabilitiesReady,
     ConfigSyncUpdate,
@@ -38,21 +54,168 @@ from argus_mcp.tui.screens.skills import SkillsScreen
 from argus_mcp.tui.screens.theme_picker import ThemeScreen
 from argus_mcp.tui.screens.tool_editor import ToolEditorScreen
 from argus_mcp.tui.screens.tools import ToolsScreen
+from argus_mcp.tui.server_manager import ServerManager
+from argus_mcp.tui.settings import load_settings, save_settings
 from argus_mcp.tui.widgets.backend_status import BackendStatusWidget
 from argus_mcp.tui.widgets.capability_tables import CapabilitySection
 from argus_mcp.tui.widgets.event_log import EventLogWidget
 from argus_mcp.tui.widgets.server_info import ServerInfoWidget
 from argus_mcp.tui.widgets.server_selector import ServerSelected, ServerSelectorWidget
+from argus_mcp.tui.widgets.sync_status import SyncStatusWidget
 
 logger = logging.getLogger(__name__)
 
+_WidgetT = TypeVar("_WidgetT", bound=Widget)
+
 # Polling interval for status updates (seconds).
 _POLL_INTERVAL = 2.0
 
+# Upper bound for the interval while the server keeps failing; each failed
+# poll doubles the interval up to this value.
+_POLL_INTERVAL_MAX = 30.0
+
+# Minimum interval while the terminal window does not have focus.
+_POLL_INTERVAL_UNFOCUSED = 10.0
+
+# Pooled connections opened to the active server before the first fetch,
+# matching the concurrent status/capabilities/events reads.
+_WARM_CONNECTIONS = 3
+
+# Number of recent events kept for the audit log screen.
+_RECENT_EVENTS_WINDOW = 50
+
+# Event IDs remembered for de-duplicating poll and stream deliveries.
+_SEEN_EVENT_IDS_MAX = 4096
+
 # Transport path suffixes that users might accidentally include in the
 # ``--server`` URL.  We strip these so the management API client always
 # targets the server root.
-_TRANSPORT_SUFFIXES = ("/mcp", "/sse", "/messages/", "/messages")
+_TRANSPORT_SUFFIX_RE = re.compile(r"/(?:mcp|sse|messages/?)$")
+
+
+# One row per mode: (name, key, alias key, footer label, screen, palette
+# title, palette help).  BINDINGS, MODES and the palette commands are all
+# derived from this table.
+_MODE_TABLE: Tuple[Tuple[str, str, Optional[str], str, Type[Screen], str, str], ...] = (
+    (
+        "dashboard",
+        "1",
+        "d",
+        "Dash",
+        DashboardScreen,
+        "Dashboard Mode",
+        "Server info, backends, events, and capabilities",
+    ),
+    (
+        "tools",
+        "2",
+        None,
+        "Tools",
+        ToolsScreen,
+        "Tools Mode",
+        "Full-screen capability explorer with filtering",
+    ),
+    ("registry", "3", None, "Reg", RegistryScreen, "Registry Mode", "Server browser and discovery"),
+    (
+        "settings",
+        "4",
+        "s",
+        "Set",
+        SettingsScreen,
+        "Settings Mode",
+        "Theme, config viewer, and preferences",
+    ),
+    ("skills", "5", None, "Skills", SkillsScreen, "Skills Mode", "Manage installed skill presets"),
+    (
+        "editor",
+        "6",
+        None,
+        "Edit",
+        ToolEditorScreen,
+        "Tool Editor Mode",
+        "Rename, filter, and customize tools",
+    ),
+    (
+        "audit",
+        "7",
+        None,
+        "Audit",
+        AuditLogScreen,
+        "Audit Log Mode",
+        "Structured event log with filters and export",
+    ),
+    (
+        "health",
+        "8",
+        "h",
+        "Health",
+        HealthScreen,
+        "Health Mode",
+        "Backend health, sessions, and version drift",
+    ),
+    (
+        "security",
+        "9",
+        None,
+        "Sec",
+        SecurityScreen,
+        "Security Mode",
+        "Auth, authorization, secrets, and network",
+    ),
+    (
+        "operations",
+        "0",
+        "o",
+        "Ops",
+        OperationsScreen,
+        "Operations Mode",
+        "Workflows, optimizer, and telemetry",
+    ),
+)
+
+
+def _mode_bindings() -> List[Binding]:
+    """Return the key bindings for every mode in :data:`_MODE_TABLE`."""
+    bindings: List[Binding] = []
+    for mode, key, alias, label, _screen, _title, _help in _MODE_TABLE:
+        action = f"switch_mode('{mode}')"
+        bindings.append(Binding(key, action, label, key_display=key))
+        if alias:
+            bindings.append(Binding(alias, action, label, show=False))
+    return bindings
+
+
+class _RecentIds:
+    """Set of the most recently added IDs, bounded to *maxlen* entries.
+
+    Membership is O(1) through a mirror ``set``; once full, adding a new ID
+    evicts the oldest one so memory stays constant however long the TUI runs.
+    """
+
+    __slots__ = ("_order", "_members")
+
+    def __init__(self, maxlen: int) -> None:
+        self._order: Deque[str] = deque(maxlen=maxlen)
+        self._members: Set[str] = set()
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def add(self, item: str) -> None:
+        if item in self._members:
+            return
+        order = self._order
+        if len(order) == order.maxlen:
+            self._members.discard(order[0])  # evicted by the append below
+        order.append(item)
+        self._members.add(item)
+
+    def clear(self) -> None:
+        self._order.clear()
+        self._members.clear()
 
 
 def _normalise_server_url(url: str | None) -> str | None:
@@ -63,11 +226,7 @@ def _normalise_server_url(url: str | None) -> str | None:
     """
     if url is None:
         return None
-    url = url.rstrip("/")
-    for suffix in _TRANSPORT_SUFFIXES:
-        if url.endswith(suffix):
-            url = url[: -len(suffix)]
-            break
+    url = _TRANSPORT_SUFFIX_RE.sub("", url.rstrip("/"), count=1)
     return url or None
 
 
@@ -82,20 +241,7 @@ class ArgusApp(App):
         # ── App ────────────────────────────────────────────────
         Binding("q", "quit", "Quit", priority=True),
         # ── Mode switching ─────────────────────────────────────
-        Binding("1", "switch_mode('dashboard')", "Dash", key_display="1"),
-        Binding("d", "switch_mode('dashboard')", "Dash", show=False),
-        Binding("2", "switch_mode('tools')", "Tools", key_display="2"),
-        Binding("3", "switch_mode('registry')", "Reg", key_display="3"),
-        Binding("4", "switch_mode('settings')", "Set", key_display="4"),
-        Binding("s", "switch_mode('settings')", "Set", show=False),
-        Binding("5", "switch_mode('skills')", "Skills", key_display="5"),
-        Binding("6", "switch_mode('editor')", "Edit", key_display="6"),
-        Binding("7", "switch_mode('audit')", "Audit", key_display="7"),
-        Binding("8", "switch_mode('health')", "Health", key_display="8"),
-        Binding("h", "switch_mode('health')", "Health", show=False),
-        Binding("9", "switch_mode('security')", "Sec", key_display="9"),
-        Binding("0", "switch_mode('operations')", "Ops", key_display="0"),
-        Binding("o", "switch_mode('operations')", "Ops", show=False),
+        *_mode_bindings(),
         # ── Actions ────────────────────────────────────────────
         Binding("x", "export_client_config", "Export Config", show=False),
         # ── Navigation (within active screen) ──────────────────
@@ -107,18 +253,7 @@ class ArgusApp(App):
         Binding("T", "open_theme_picker", "Themes", key_display="shift+t", show=False),
     ]
 
-    MODES = {
-        "dashboard": DashboardScreen,
-        "tools": ToolsScreen,
-        "registry": RegistryScreen,
-        "settings": SettingsScreen,
-        "skills": SkillsScreen,
-        "editor": ToolEditorScreen,
-        "audit": AuditLogScreen,
-        "health": HealthScreen,
-        "security": SecurityScreen,
-        "operations": OperationsScreen,
-    }
+    MODES = {mode: screen for mode, _key, _alias, _label, screen, _title, _help in _MODE_TABLE}
 
     DEFAULT_MODE = "dashboard"
 
@@ -129,7 +264,7 @@ class ArgusApp(App):
         server_url: Optional[str] = None,
         token: Optional[str] = None,
         *,
-        server_manager: Optional[object] = None,
+        server_manager: Optional[ServerManager] = None,
     ) -> None:
         super().__init__()
 
@@ -140,17 +275,78 @@ class ArgusApp(App):
         self._token = token
 
         # Server manager — always used for connection management
-        self._server_manager: Optional[object] = server_manager  # ServerManager
+        self._server_manager: Optional[ServerManager] = server_manager
+
+        # Set once _init_after_mode_switch has wired up the dashboard
+        self._dashboard_init_done = False
 
         # Polling state
         self._connected = False
         self._caps_loaded = False
-        self._seen_event_ids: Set[str] = set()
-        self._poll_timer: Optional[object] = None
+        # ID of the newest event applied; polls request only events after it
+        self._last_event_id: Optional[str] = None
+        # Safety net against an event arriving twice (e.g. via both the
+        # stream and a poll); bounded, unlike a plain set
+        self._seen_event_ids = _RecentIds(_SEEN_EVENT_IDS_MAX)
+        self._poll_timer: Optional[Timer] = None
+        # Base interval (``poll_interval_seconds`` setting) and the current,
+        # possibly backed-off, interval
+        self._poll_interval_base = _POLL_INTERVAL
+        self._poll_interval = _POLL_INTERVAL
+        self._polling_stopped = False
+        # Single-flight guard; _poll_again asks the running cycle to repeat
+        self._poll_inflight = False
+        self._poll_again = False
+        # Cleared when the active server predates /manage/v1/snapshot
+        self._snapshot_supported = True
+        # Pushed events (SSE); while the stream is live, polling skips /events
+        self._event_stream_worker: Optional[Worker[None]] = None
+        self._event_stream_active = False
+        self._event_stream_supported = True
 
         # Cached data for cross-screen access
         self._last_status: Optional[Any] = None
         self._last_caps: Optional[Any] = None
+        # Response the capability tables were last filled from
+        self._populated_caps: Optional[Any] = None
+        self._last_events: Optional[Any] = None
+        # Backend models from the last poll and when they arrived (monotonic)
+        self._last_backends: Optional[List[BackendDetail]] = None
+        self._last_backends_at = 0.0
+
+        # Server selector: refresh coalescing and the last rendered state
+        self._selector_refresh_pending = False
+        self._selector_state: Optional[Tuple[Widget, Tuple[Any, ...]]] = None
+
+        # Widget class → (screen, widget) from the last lookup; see _widget()
+        self._widget_cache: Dict[type, Tuple[Screen, Widget]] = {}
+
+        # Registry mode state, shared by RegistryScreen instances so that
+        # re-entering the mode reuses clients and the last fetched catalog
+        self._registry_cache: Optional[RegistryCache] = None
+        self._registry_clients: Optional[Dict[str, RegistryClient]] = None
+        # (monotonic fetch time, registry URLs, entries)
+        self._registry_catalog: Optional[Tuple[float, Tuple[str, ...], List[ServerEntry]]] = None
+
+        # Command-palette entries; callbacks are bound once, not per opening
+        self._argus_commands = self._build_system_commands()
+
+    # ── Widget lookup ───────────────────────────────────────────
+
+    def _widget(self, widget_type: Type[_WidgetT]) -> _WidgetT:
+        """Return the *widget_type* instance on the active screen.
+
+        Like ``self.screen.query_one(widget_type)`` (and raises the same
+        ``NoMatches``), but the result is remembered per screen so that
+        repeated updates on every poll skip the DOM walk.
+        """
+        screen = self.screen
+        cached = self._widget_cache.get(widget_type)
+        if cached is not None and cached[0] is screen and cached[1].is_mounted:
+            return cached[1]  # type: ignore[return-value]
+        widget = screen.query_one(widget_type)
+        self._widget_cache[widget_type] = (screen, widget)
+        return widget
 
     # ── Compose (fallback — replaced immediately by default mode) ──
 
@@ -164,108 +360,68 @@ class ArgusApp(App):
         """Extend the command palette with Argus MCP commands."""
         yield from super().get_system_commands(screen)
 
-        # ── Modes ──────────────────────────────────────────────
-        yield SystemCommand(
-            title="Dashboard Mode",
-            help="Server info, backends, events, and capabilities (1/d)",
-            callback=lambda: self.switch_mode("dashboard"),
-        )
-        yield SystemCommand(
-            title="Tools Mode",
-            help="Full-screen capability explorer with filtering (2)",
-            callback=lambda: self.switch_mode("tools"),
-        )
-        yield SystemCommand(
-            title="Registry Mode",
-            help="Server browser and discovery (3)",
-            callback=lambda: self.switch_mode("registry"),
-        )
-        yield SystemCommand(
-            title="Settings Mode",
-            help="Theme, config viewer, and preferences (4/s)",
-            callback=lambda: self.switch_mode("settings"),
-        )
-        yield SystemCommand(
-            title="Skills Mode",
-            help="Manage installed skill presets (5)",
-            callback=lambda: self.switch_mode("skills"),
-        )
-        yield SystemCommand(
-            title="Tool Editor Mode",
-            help="Rename, filter, and customize tools (6)",
-            callback=lambda: self.switch_mode("editor"),
-        )
-        yield SystemCommand(
-            title="Audit Log Mode",
-            help="Structured event log with filters and export (7)",
-            callback=lambda: self.switch_mode("audit"),
-        )
-        yield SystemCommand(
-            title="Health Mode",
-            help="Backend health, sessions, and version drift (8/h)",
-            callback=lambda: self.switch_mode("health"),
-        )
-        yield SystemCommand(
-            title="Security Mode",
-            help="Auth, authorization, secrets, and network (9)",
-            callback=lambda: self.switch_mode("security"),
-        )
-        yield SystemCommand(
-            title="Operations Mode",
-            help="Workflows, optimizer, and telemetry (0/o)",
-            callback=lambda: self.switch_mode("operations"),
-        )
-        yield SystemCommand(
-            title="Export Client Config",
-            help="Generate config for VS Code, Cursor, Claude, etc.",
-            callback=self.action_export_client_config,
-        )
-
-        # ── Server ─────────────────────────────────────────────
-        yield SystemCommand(
-            title="Show Server Details",
-            help="Configuration file, log file, and log level",
-            callback=self._show_server_details,
-        )
-        yield SystemCommand(
-            title="Show Connection Info",
-            help="SSE endpoint URL and backend status",
-            callback=self._show_connection_info,
-        )
+        yield from self._argus_commands
 
-        # ── Navigation ─────────────────────────────────────────
-        yield SystemCommand(
-            title="Show Tools Tab",
-            help="Switch capability tables to the Tools tab",
-            callback=self.action_show_tools,
-        )
-        yield SystemCommand(
-            title="Show Resources Tab",
-            help="Switch capability tables to the Resources tab",
-            callback=self.action_show_resources,
-        )
-        yield SystemCommand(
-            title="Show Prompts Tab",
-            help="Switch capability tables to the Prompts tab",
-            callback=self.action_show_prompts,
-        )
-
-        # ── Appearance ─────────────────────────────────────────
-        yield SystemCommand(
-            title="Open Theme Picker",
-            help="Browse and preview all available themes",
-            callback=self.action_open_theme_picker,
+    def _build_system_commands(self) -> Tuple[SystemCommand, ...]:
+        """Build the Argus MCP command-palette entries (once per app)."""
+        modes = tuple(
+            SystemCommand(
+                title=title,
+                help=f"{help_text} ({key}/{alias})" if alias else f"{help_text} ({key})",
+                callback=partial(self.switch_mode, mode),
+            )
+            for mode, key, alias, _label, _screen, title, help_text in _MODE_TABLE
         )
-        yield SystemCommand(
-            title="Cycle Theme",
-            help="Switch to the next enabled theme",
-            callback=self.action_next_theme,
+        return modes + (
+            SystemCommand(
+                title="Export Client Config",
+                help="Generate config for VS Code, Cursor, Claude, etc.",
+                callback=self.action_export_client_config,
+            ),
+            # ── Server ─────────────────────────────────────────────
+            SystemCommand(
+                title="Show Server Details",
+                help="Configuration file, log file, and log level",
+                callback=self._show_server_details,
+            ),
+            SystemCommand(
+                title="Show Connection Info",
+                help="SSE endpoint URL and backend status",
+                callback=self._show_connection_info,
+            ),
+            # ── Navigation ─────────────────────────────────────────
+            SystemCommand(
+                title="Show Tools Tab",
+                help="Switch capability tables to the Tools tab",
+                callback=self.action_show_tools,
+            ),
+            SystemCommand(
+                title="Show Resources Tab",
+                help="Switch capability tables to the Resources tab",
+                callback=self.action_show_resources,
+            ),
+            SystemCommand(
+                title="Show Prompts Tab",
+                help="Switch capability tables to the Prompts tab",
+                callback=self.action_show_prompts,
+            ),
+            # ── Appearance ─────────────────────────────────────────
+            SystemCommand(
+                title="Open Theme Picker",
+                help="Browse and preview all available themes",
+                callback=self.action_open_theme_picker,
+            ),
+            SystemCommand(
+                title="Cycle Theme",
+                help="Switch to the next enabled theme",
+                callback=self.action_next_theme,
+            ),
         )
 
     def _show_server_details(self) -> None:
         """Show server config details via notification."""
         try:
-            srv = self.screen.query_one(ServerInfoWidget)
+            srv = self._widget(ServerInfoWidget)
             lines = [
                 f"[b]Config file:[/b]  {srv.config_file}",
                 f"[b]Log file:[/b]    {srv.log_file}",
@@ -282,8 +438,8 @@ class ArgusApp(App):
     def _show_connection_info(self) -> None:
         """Show connection info via notification."""
         try:
-            srv = self.screen.query_one(ServerInfoWidget)
-            bk = self.screen.query_one(BackendStatusWidget)
+            srv = self._widget(ServerInfoWidget)
+            bk = self._widget(BackendStatusWidget)
             lines = [
                 f"[b]SSE URL:[/b]    {srv.sse_url}",
                 f"[b]Backends:[/b]   {bk.connected}/{bk.total} connected",
@@ -298,12 +454,16 @@ class ArgusApp(App):
     def on_mount(self) -> None:
         """Called after the TUI is fully mounted."""
         # Load saved theme preference
-        from argus_mcp.tui.settings import load_settings
-
         settings = load_settings()
         saved_theme = settings.get("theme", "textual-dark")
         if saved_theme in self.available_themes:
             self.theme = saved_theme
+        try:
+            interval = float(settings.get("poll_interval_seconds", _POLL_INTERVAL))
+        except (TypeError, ValueError):
+            interval = _POLL_INTERVAL
+        self._poll_interval_base = min(max(interval, 0.5), _POLL_INTERVAL_MAX)
+        self._poll_interval = self._poll_interval_base
 
         # Ensure we have a ServerManager
         self._ensure_server_manager()
@@ -318,7 +478,7 @@ class ArgusApp(App):
         Safe to call multiple times — becomes a no-op after the first
         successful run.
         """
-        if getattr(self, "_dashboard_init_done", False):
+        if self._dashboard_init_done:
             return
         try:
             scr = self.screen
@@ -339,8 +499,6 @@ class ArgusApp(App):
         if self._server_manager is not None:
             return
 
-        from argus_mcp.tui.server_manager import ServerManager
-
         if self._server_url:
             # Single-server mode via --server URL
             self._server_manager = ServerManager.from_single(
@@ -352,14 +510,10 @@ class ArgusApp(App):
 
     def _start_remote_mode(self, info: ServerInfoWidget, event_log: EventLogWidget) -> None:
         """Initialize remote-mode: connect to server(s) via HTTP."""
-        from argus_mcp.tui.server_manager import ServerManager
-
         mgr: ServerManager = self._server_manager  # type: ignore[assignment]
 
         if mgr.count == 0:
             # No servers configured — add a default
-            from argus_mcp.constants import DEFAULT_HOST, DEFAULT_PORT
-
             default_url = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
             mgr.add("local", default_url, set_active=True)
             mgr.save()
@@ -383,23 +537,41 @@ class ArgusApp(App):
 
     def on_unmount(self) -> None:
         """Clean up on app exit."""
-        # Stop polling timer
+        # Stop polling timer and the event stream
+        self._polling_stopped = True
         if self._poll_timer is not None:
             self._poll_timer.stop()
+        self._stop_event_stream()
 
         # Close API clients via server manager
         if self._server_manager is not None:
-            from argus_mcp.tui.server_manager import ServerManager
-
             if isinstance(self._server_manager, ServerManager):
-                self.run_worker(self._server_manager.close_all(), exclusive=True)
+                self.run_worker(self._close_connections(self._server_manager), exclusive=True)
+        if self._registry_clients:
+            self.run_worker(self._close_registry_clients(list(self._registry_clients.values())))
+            self._registry_clients = None
 
         # Stop capturing print()
         try:
-            self.screen.query_one(EventLogWidget).stop_capture()
+            self._widget(EventLogWidget).stop_capture()
         except Exception:
             pass
 
+    @staticmethod
+    async def _close_connections(mgr: Any) -> None:
+        """Close every server client, then the shared HTTP connection pool."""
+        await mgr.close_all()
+        await close_shared_client()
+
+    @staticmethod
+    async def _close_registry_clients(clients: List[RegistryClient]) -> None:
+        """Close the HTTP clients shared by the Registry mode."""
+        for client in clients:
+            try:
+                await client.close()
+            except Exception:
+                logger.debug("Failed to close registry client", exc_info=True)
+
     # ── Remote-mode polling ─────────────────────────────────────
 
     def _start_polling(self) -> None:
@@ -412,8 +584,6 @@ class ArgusApp(App):
 
     async def _initial_connect(self) -> None:
         """Connect all servers via the manager and fetch initial state."""
-        from argus_mcp.tui.server_manager import ServerManager
-
         mgr: ServerManager = self._server_manager  # type: ignore[assignment]
 
         results = await mgr.connect_all()
@@ -426,24 +596,31 @@ class ArgusApp(App):
         # Update selector after connect attempts
         self._refresh_server_selector()
 
+        # Other servers are warmed off the startup path; nothing waits on it
+        self.run_worker(mgr.warm_standby(), group="warmup", name="warm-standby")
+
         # Fetch state from the active server
         client = mgr.active_client
         if client is not None:
+            # Open the sockets the first fetch below will use in parallel
+            await client.warm(_WARM_CONNECTIONS)
             try:
                 health = await client.get_health()
                 logger.info("Initial health check: %s", health.status)
                 self._connected = True
                 self.post_message(ConnectionRestored())
 
-                status = await client.get_status()
+                # Independent reads — overlap them on the pooled connections
+                status, caps, events = await asyncio.gather(
+                    client.get_status(),
+                    client.get_capabilities(),
+                    client.get_events(limit=50, after=self._last_event_id),
+                )
                 self._apply_status_response(status)
-
-                caps = await client.get_capabilities()
                 self._apply_capabilities_response(caps)
                 self._caps_loaded = True
-
-                events = await client.get_events(limit=50)
                 self._apply_events_response(events)
+                self._start_event_stream(client)
             except Exception as exc:
                 logger.warning("Initial data fetch failed: %s", exc)
                 self.post_message(ConnectionLost(reason=f"Cannot reach server: {exc}"))
@@ -456,16 +633,63 @@ class ArgusApp(App):
             self.post_message(ConnectionLost(reason=reason))
 
         # Start periodic polling regardless — it will retry on failure
-        self._poll_timer = self.set_interval(_POLL_INTERVAL, self._poll_tick, name="status-poll")
+        self._schedule_poll()
+
+    def _schedule_poll(self) -> None:
+        """Arm a one-shot timer for the next poll at the current interval.
+
+        The interval backs off while the server is unreachable and is
+        stretched while the terminal does not have focus.
+        """
+        if self._polling_stopped:
+            return
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+        delay = self._poll_interval
+        if not self.app_focus:
+            delay = max(delay, _POLL_INTERVAL_UNFOCUSED)
+        self._poll_timer = self.set_timer(delay, self._poll_tick, name="status-poll")
 
     def _poll_tick(self) -> None:
         """Timer callback: dispatch async poll worker."""
-        self.run_worker(self._poll_once(), exclusive=True, name="poll")
+        self._request_poll(name="poll")
+
+    def _request_poll(self, name: str) -> None:
+        """Start a poll cycle now, or right after the one in flight.
+
+        Polls never overlap and an in-flight poll is never cancelled, so a
+        slow server stretches the cycle instead of having its half-finished
+        requests aborted and retried.
+        """
+        if self._poll_inflight:
+            self._poll_again = True
+            return
+        self._poll_inflight = True
+        self._poll_again = False
+        self.run_worker(self._poll_and_reschedule(), group="poll", name=name)
+
+    async def _poll_and_reschedule(self) -> None:
+        """Run poll cycles until none is pending, then schedule the next one."""
+        try:
+            await self._poll_once()
+            while self._poll_again and not self._polling_stopped:
+                self._poll_again = False
+                await self._poll_once()
+        finally:
+            self._poll_inflight = False
+            self._schedule_poll()
+
+    def _poll_failed(self) -> None:
+        """Double the poll interval, up to :data:`_POLL_INTERVAL_MAX`."""
+        self._poll_interval = min(self._poll_interval * 2, _POLL_INTERVAL_MAX)
+
+    def watch_app_focus(self, focus: bool) -> None:
+        # Poll promptly on return instead of waiting out the stretched delay
+        if focus and self._poll_timer is not None:
+            self._schedule_poll()
 
     async def _poll_once(self) -> None:
         """Single poll cycle: fetch status + events from active server."""
-        from argus_mcp.tui.server_manager import ServerManager
-
         mgr: ServerManager = self._server_manager  # type: ignore[assignment]
         entry = mgr.active_entry
         if entry is None:
@@ -480,37 +704,43 @@ class ArgusApp(App):
                 await mgr.connect(name)
                 client = mgr.active_client
             except Exception:
+                self._poll_failed()
                 return
 
         if client is None:
             return
 
         try:
-            status = await client.get_status()
+            # Capabilities are re-fetched after every reconnect
+            want_caps = not self._caps_loaded or not self._connected
+            want_events = not self._event_stream_active
+            status, caps, events, backends_resp = await self._fetch_poll_data(
+                client, want_caps, want_events
+            )
             self._apply_status_response(status)
 
             if not self._connected:
                 self._connected = True
-                self._caps_loaded = False
                 mgr.mark_connected(name)
                 self.post_message(ConnectionRestored())
+                self._start_event_stream(client)
 
-            if not self._caps_loaded:
-                caps = await client.get_capabilities()
-                self._apply_capabilities_response(caps)
+            if caps is not None:
+                if caps is not self._last_caps:
+                    self._apply_capabilities_response(caps)
                 self._caps_loaded = True
 
-            events = await client.get_events(limit=20)
-            self._apply_events_response(events)
+            if events is not None:
+                self._apply_events_response(events)
 
-            # Fetch backends for phase-aware status display
-            try:
-                backends_resp = await client.get_backends()
+            # Phase-aware status display
+            if backends_resp is not None:
                 self._apply_backends_response(backends_resp)
-            except Exception:
-                pass  # Non-critical — status poll already covers basics
+
+            self._poll_interval = self._poll_interval_base
 
         except Exception as exc:
+            self._poll_failed()
             was_connected = self._connected
             self._connected = False
             self._caps_loaded = False
@@ -523,13 +753,125 @@ class ArgusApp(App):
         # Refresh selector to reflect connection status changes
         self._refresh_server_selector()
 
+    async def _fetch_poll_data(
+        self, client: Any, want_caps: bool, want_events: bool = True
+    ) -> Tuple[Any, Optional[Any], Optional[Any], Optional[Any]]:
+        """Fetch ``(status, caps, events, backends)`` for one poll cycle.
+
+        Uses a single ``/snapshot`` request when the server supports it and
+        falls back to the individual endpoints otherwise.  *caps* and
+        *events* are ``None`` unless requested; *backends* is ``None`` if
+        that (non-critical) request failed.
+        """
+        if self._snapshot_supported:
+            include = ["status", "backends"]
+            if want_events:
+                include.append("events")
+            try:
+                if want_caps:
+                    # Capabilities go through their own conditional GET so an
+                    # unchanged set is revalidated (304) instead of re-sent.
+                    bundle, caps = await asyncio.gather(
+                        client.get_snapshot(
+                            include=include, events_limit=20, events_after=self._last_event_id
+                        ),
+                        client.get_capabilities(),
+                    )
+                else:
+                    bundle = await client.get_snapshot(
+                        include=include, events_limit=20, events_after=self._last_event_id
+                    )
+                    caps = None
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code != 404:
+                    raise
+                logger.info("Server has no snapshot endpoint; polling endpoints individually")
+                self._snapshot_supported = False
+            else:
+                return bundle.status, caps, bundle.events, bundle.backends
+
+        # Independent reads — issue them concurrently so a tick costs the
+        # slowest request rather than the sum of all of them.
+        requests = {"status": client.get_status(), "backends": client.get_backends()}
+        if want_events:
+            requests["events"] = client.get_events(limit=20, after=self._last_event_id)
+        if want_caps:
+            requests["capabilities"] = client.get_capabilities()
+        results = dict(
+            zip(requests, await asyncio.gather(*requests.values(), return_exceptions=True))
+        )
+
+        for key in ("status", "events", "capabilities"):
+            if isinstance(results.get(key), BaseException):
+                raise results[key]
+        backends_resp = results["backends"]
+        if isinstance(backends_resp, BaseException):
+            backends_resp = None  # Non-critical — status poll already covers basics
+        return results["status"], results.get("capabilities"), results.get("events"), backends_resp
+
+    # ── Event stream (SSE push) ─────────────────────────────────
+
+    def _start_event_stream(self, client: Any) -> None:
+        """(Re)start the worker that consumes pushed events from *client*."""
+        self._stop_event_stream()
+        if not self._event_stream_supported:
+            return
+        self._event_stream_worker = self.run_worker(
+            self._consume_event_stream(client),
+            name="event-stream",
+            group="event-stream",
+            exit_on_error=False,
+        )
+
+    def _stop_event_stream(self) -> None:
+        """Cancel the event-stream worker, returning events to polling."""
+        worker = self._event_stream_worker
+        self._event_stream_worker = None
+        self._event_stream_active = False
+        if worker is not None:
+            worker.cancel()
+
+    async def _consume_event_stream(self, client: Any) -> None:
+        """Worker: apply events pushed over SSE until the stream ends.
+
+        Polling stops fetching ``/events`` while the stream is live and
+        resumes as soon as it ends, fails, or is unsupported (404).
+        """
+        self._event_stream_active = True
+        try:
+            async for ev in client.stream_events():
+                self._apply_pushed_event(ev)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                logger.info("Server has no event stream; polling for events")
+                self._event_stream_supported = False
+            else:
+                logger.debug("Event stream failed: %s", exc)
+        except Exception as exc:
+            logger.debug("Event stream disconnected: %s", exc)
+        finally:
+            self._event_stream_active = False
+
+    def _apply_pushed_event(self, ev: Any) -> None:
+        """Show one pushed event and keep the audit-log cache window current."""
+        self._remember_events([ev])
+        self._show_events([ev])
+
+    def _remember_events(self, new_events: List[Any]) -> None:
+        """Append *new_events* to the recent-events window cached for the audit log."""
+        if not new_events:
+            return
+        previous = self._last_events.events if self._last_events is not None else []
+        window = (list(previous) + list(new_events))[-_RECENT_EVENTS_WINDOW:]
+        self._last_events = EventsResponse(events=window)
+
     # ── Response → TUI message adapters ─────────────────────────
 
     def _apply_status_response(self, status: Any) -> None:
         """Convert a StatusResponse into widget updates."""
         self._last_status = status
         try:
-            srv_widget = self.screen.query_one(ServerInfoWidget)
+            srv_widget = self._widget(ServerInfoWidget)
             srv_widget.server_version = status.service.version or SERVER_VERSION
             srv_widget.sse_url = status.transport.sse_url or self._server_url or ""
             srv_widget.streamable_http_url = status.transport.streamable_http_url or ""
@@ -541,7 +883,7 @@ class ArgusApp(App):
             pass  # Widget not in active screen
 
         try:
-            backend = self.screen.query_one(BackendStatusWidget)
+            backend = self._widget(BackendStatusWidget)
             backend.total = status.config.backend_count
             if status.service.state == "running":
                 backend.connected = status.config.backend_count
@@ -552,31 +894,40 @@ class ArgusApp(App):
 
     def _apply_backends_response(self, backends_resp: Any) -> None:
         """Feed phase-aware backend data into BackendStatusWidget."""
+        self._last_backends = backends_resp.backends
+        self._last_backends_at = time.monotonic()
         try:
-            backend_widget = self.screen.query_one(BackendStatusWidget)
-            details = [b.model_dump() for b in backends_resp.backends]
+            backend_widget = self._widget(BackendStatusWidget)
+            # The dashboard widget (and its detail modal) work on plain dicts
+            details = backends_resp.model_dump()["backends"]
             backend_widget.update_from_backends(details)
         except Exception:
             pass  # Widget not in active screen
 
     def _apply_capabilities_response(self, caps: Any) -> None:
-        """Convert a CapabilitiesResponse into widget updates."""
+        """Convert a CapabilitiesResponse into widget updates.
+
+        Skipped when *caps* equals the response the tables were last
+        populated from.
+        """
         self._last_caps = caps
+        if self._populated_caps is not None and caps == self._populated_caps:
+            return
 
-        # Convert Pydantic models to dicts for populate()
-        tools = [t.model_dump() for t in caps.tools]
-        resources = [r.model_dump() for r in caps.resources]
-        prompts = [p.model_dump() for p in caps.prompts]
-        route_map = caps.route_map
+        # populate() reads attributes directly, so the models need no model_dump()
+        tools = caps.tools
+        resources = caps.resources
+        prompts = caps.prompts
 
         try:
-            cap_section = self.screen.query_one(CapabilitySection)
-            cap_section.populate(tools, resources, prompts, route_map)
+            cap_section = self._widget(CapabilitySection)
+            cap_section.populate(tools, resources, prompts, caps.route_map)
+            self._populated_caps = caps
         except Exception:
             pass  # Widget not in active screen
 
         try:
-            event_log = self.screen.query_one(EventLogWidget)
+            event_log = self._widget(EventLogWidget)
             event_log.add_event(
                 "✅ Service Ready",
                 f"{len(tools)} tools, {len(resources)} resources, {len(prompts)} prompts loaded",
@@ -590,27 +941,37 @@ class ArgusApp(App):
         Also detects ``config_sync`` stage events and posts a
         :class:`ConfigSyncUpdate` Textual message for :class:`SyncStatusWidget`.
         """
-        self._last_events = events_resp  # Cache for audit log screen
-        for ev in events_resp.events:
-            if ev.id in self._seen_event_ids:
-                continue
-            self._seen_event_ids.add(ev.id)
-            extra: list[str] = []
-            if ev.details:
-                for k, v in ev.details.items():
-                    extra.append(f"{k}: {v}")
-            try:
-                event_log = self.screen.query_one(EventLogWidget)
-                event_log.add_event(
+        # Responses carry only events after _last_event_id
+        self._remember_events(events_resp.events)  # Cache for audit log screen
+        self._show_events(events_resp.events)
+
+    def _show_events(self, events: List[Any]) -> None:
+        """Write *events* to the log in one batch and advance the event cursor."""
+        if not events:
+            return
+        self._last_event_id = events[-1].id
+        seen = self._seen_event_ids
+        fresh = [ev for ev in events if ev.id not in seen]
+        if not fresh:
+            return
+        for ev in fresh:
+            seen.add(ev.id)
+        events = fresh
+        try:
+            self._widget(EventLogWidget).add_events(
+                (
                     ev.stage,
                     ev.message,
-                    timestamp=ev.timestamp,
-                    extra_lines=extra if extra else None,
+                    ev.timestamp,
+                    [f"{k}: {v}" for k, v in ev.details.items()] if ev.details else None,
                 )
-            except Exception:
-                pass  # Widget not in active screen
+                for ev in events
+            )
+        except Exception:
+            pass  # Widget not in active screen
 
-            # Bridge config_sync events to SyncStatusWidget
+        # Bridge config_sync events to SyncStatusWidget
+        for ev in events:
             if ev.stage == "config_sync" and ev.details:
                 details = ev.details if isinstance(ev.details, dict) else {}
                 self.post_message(
@@ -625,10 +986,8 @@ class ArgusApp(App):
 
     def on_config_sync_update(self, event: ConfigSyncUpdate) -> None:
         """Handle a config sync event by updating the SyncStatusWidget."""
-        from argus_mcp.tui.widgets.sync_status import SyncStatusWidget
-
         try:
-            widget = self.screen.query_one(SyncStatusWidget)
+            widget = self._widget(SyncStatusWidget)
             widget.update_sync_status(
                 config_file=event.config_file,
                 config_hash=event.config_hash,
@@ -648,18 +1007,39 @@ class ArgusApp(App):
     # ── Server selector ───────────────────────────────────────────
 
     def _refresh_server_selector(self) -> None:
-        """Update the ServerSelectorWidget with current server entries."""
-        from argus_mcp.tui.server_manager import ServerManager
+        """Schedule a ServerSelectorWidget update for after the next refresh.
 
-        mgr: Optional[ServerManager] = self._server_manager  # type: ignore[assignment]
+        Several requests within one event-loop pass collapse into one update.
+        """
+        if self._selector_refresh_pending:
+            return
+        self._selector_refresh_pending = True
+        self.call_after_refresh(self._update_server_selector)
+
+    def _update_server_selector(self) -> None:
+        """Update the ServerSelectorWidget with current server entries.
+
+        No-op when the entries, their connection state and the active server
+        are unchanged since the widget was last updated.
+        """
+        self._selector_refresh_pending = False
+
+        mgr = self._server_manager
         if mgr is None:
             return
 
         try:
-            selector = self.screen.query_one("#srv-selector", ServerSelectorWidget)
+            selector = self._widget(ServerSelectorWidget)
         except Exception:
             return  # widget not mounted yet
 
+        fingerprint = (
+            mgr.active_name,
+            tuple((e.name, e.url, e.connected) for e in mgr.entries.values()),
+        )
+        if self._selector_state == (selector, fingerprint):
+            return
+
         servers = [
             {
                 "name": e.name,
@@ -669,12 +1049,11 @@ class ArgusApp(App):
             for e in mgr.entries.values()
         ]
         selector.refresh_servers(servers, active_name=mgr.active_name)
+        self._selector_state = (selector, fingerprint)
 
     def on_server_selected(self, event: ServerSelected) -> None:
         """Handle the user switching to a different server."""
-        from argus_mcp.tui.server_manager import ServerManager
-
-        mgr: Optional[ServerManager] = self._server_manager  # type: ignore[assignment]
+        mgr = self._server_manager
         if mgr is None:
             return
 
@@ -687,20 +1066,26 @@ class ArgusApp(App):
         # Reset state for the new server
         self._connected = False
         self._caps_loaded = False
+        self._snapshot_supported = True
+        self._event_stream_supported = True
+        self._stop_event_stream()
+        self._last_event_id = None
+        self._last_events = None
+        self._last_backends = None
         self._seen_event_ids.clear()
 
         # Update the info panel
         entry = mgr.active_entry
         if entry:
             try:
-                srv_widget = self.screen.query_one(ServerInfoWidget)
+                srv_widget = self._widget(ServerInfoWidget)
                 srv_widget.sse_url = entry.url
                 srv_widget.status_text = "Connecting\u2026" if not entry.connected else "Connected"
             except Exception:
                 pass
 
             try:
-                event_log = self.screen.query_one(EventLogWidget)
+                event_log = self._widget(EventLogWidget)
                 event_log.add_event(
                     "Server Switch",
                     f"Switched to '{name}' ({entry.url})",
@@ -708,8 +1093,9 @@ class ArgusApp(App):
             except Exception:
                 pass
 
-        # Force an immediate poll
-        self.run_worker(self._poll_once(), exclusive=True, name="poll-switch")
+        # Force an immediate poll; the new server starts at the base interval
+        self._poll_interval = self._poll_interval_base
+        self._request_poll(name="poll-switch")
 
         # Refresh selector display
         self._refresh_server_selector()
@@ -718,7 +1104,7 @@ class ArgusApp(App):
 
     def on_capabilities_ready(self, event: CapabilitiesReady) -> None:
         """Explicit capability population (alternative path)."""
-        cap = self.screen.query_one(CapabilitySection)
+        cap = self._widget(CapabilitySection)
         cap.populate(
             event.tools,
             event.resources,
@@ -729,13 +1115,13 @@ class ArgusApp(App):
     def on_connection_lost(self, event: ConnectionLost) -> None:
         """Handle loss of HTTP connection to the remote server."""
         try:
-            srv_widget = self.screen.query_one(ServerInfoWidget)
+            srv_widget = self._widget(ServerInfoWidget)
             srv_widget.status_text = "Disconnected"
         except Exception:
             pass  # Widget not in active screen
 
         try:
-            event_log = self.screen.query_one(EventLogWidget)
+            event_log = self._widget(EventLogWidget)
             event_log.add_event(
                 "⚠️  Connection Lost",
                 event.reason,
@@ -752,13 +1138,13 @@ class ArgusApp(App):
     def on_connection_restored(self, event: ConnectionRestored) -> None:
         """Handle reconnection to the remote server."""
         try:
-            srv_widget = self.screen.query_one(ServerInfoWidget)
+            srv_widget = self._widget(ServerInfoWidget)
             srv_widget.status_text = "Connected"
         except Exception:
             pass  # Widget not in active screen
 
         try:
-            event_log = self.screen.query_one(EventLogWidget)
+            event_log = self._widget(EventLogWidget)
             event_log.add_event(
                 "✅ Reconnected",
                 "Connection to server restored.",
@@ -803,7 +1189,7 @@ class ArgusApp(App):
             await client.post_reconnect(name)
             self.notify(f"Reconnect '{name}' requested", title="Backend", severity="information")
             try:
-                event_log = self.screen.query_one(EventLogWidget)
+                event_log = self._widget(EventLogWidget)
                 event_log.add_event("🔄 Reconnect", f"Requested reconnect for '{name}'")
             except Exception:
                 pass
@@ -814,33 +1200,22 @@ class ArgusApp(App):
 
     def action_show_tools(self) -> None:
         """Switch capability table to Tools tab."""
-        try:
-            from textual.widgets import TabbedContent
-
-            tabs = self.screen.query_one("#cap-tabs", TabbedContent)
-            tabs.active = "tab-tools"
-        except Exception:
-            logger.debug("Could not switch to tools tab", exc_info=True)
+        self._switch_cap_tab("tab-tools")
 
     def action_show_resources(self) -> None:
         """Switch capability table to Resources tab."""
-        try:
-            from textual.widgets import TabbedContent
-
-            tabs = self.screen.query_one("#cap-tabs", TabbedContent)
-            tabs.active = "tab-resources"
-        except Exception:
-            logger.debug("Could not switch to resources tab", exc_info=True)
+        self._switch_cap_tab("tab-resources")
 
     def action_show_prompts(self) -> None:
         """Switch capability table to Prompts tab."""
-        try:
-            from textual.widgets import TabbedContent
+        self._switch_cap_tab("tab-prompts")
 
-            tabs = self.screen.query_one("#cap-tabs", TabbedContent)
-            tabs.active = "tab-prompts"
+    def _switch_cap_tab(self, tab_id: str) -> None:
+        """Activate *tab_id* in the capability tabs of the active screen."""
+        try:
+            self.screen.query_one("#cap-tabs", TabbedContent).active = tab_id
         except Exception:
-            logger.debug("Could not switch to prompts tab", exc_info=True)
+            logger.debug("Could not switch to %s", tab_id, exc_info=True)
 
     def action_quit(self) -> None:
         """Gracefully exit the TUI via the exit modal."""
@@ -849,7 +1224,7 @@ class ArgusApp(App):
         try:
             mgr = self._server_manager
             if mgr is not None:
-                backends_running = sum(1 for e in mgr.entries.values() if e.connected)
+                backends_running = mgr.connected_count
         except Exception:
             pass
 
@@ -857,7 +1232,7 @@ class ArgusApp(App):
             if result is None:
                 return  # Cancelled
             try:
-                event_log = self.screen.query_one(EventLogWidget)
+                event_log = self._widget(EventLogWidget)
                 event_log.add_event("🛑 Shutting Down", f"Exit mode: {result}")
             except Exception:
                 pass
@@ -867,8 +1242,6 @@ class ArgusApp(App):
                 self.run_worker(self._shutdown_then_exit(), name="shutdown-exit")
             else:
                 # save-and-exit: just save settings and exit
-                from argus_mcp.tui.settings import load_settings, save_settings
-
                 settings = load_settings()
                 settings["theme"] = self.theme or "textual-dark"
                 save_settings(settings)
@@ -889,8 +1262,6 @@ class ArgusApp(App):
                     await client.post_shutdown()
                 except Exception as exc:
                     logger.warning("Shutdown request failed: %s", exc)
-        from argus_mcp.tui.settings import load_settings, save_settings
-
         settings = load_settings()
         settings["theme"] = self.theme or "textual-dark"
         save_settings(settings)
@@ -898,8 +1269,6 @@ class ArgusApp(App):
 
     def action_next_theme(self) -> None:
         """Cycle to the next enabled theme and persist the choice."""
-        from argus_mcp.tui.settings import load_settings, save_settings
-
         settings = load_settings()
         enabled = settings.get("enabled_themes", ["textual-dark"])
         # Filter to themes actually registered
@@ -925,8 +1294,6 @@ class ArgusApp(App):
 
         def _on_theme_selected(theme_name: str | None) -> None:
             if theme_name is not None:
-                from argus_mcp.tui.settings import load_settings, save_settings
-
                 settings = load_settings()
                 settings["theme"] = theme_name
                 save_settings(settings)
@@ -944,7 +1311,5 @@ class ArgusApp(App):
             if url:
                 sse_url = url
         if not sse_url:
-            from argus_mcp.constants import DEFAULT_HOST, DEFAULT_PORT
-
             sse_url = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
         self.push_screen(ClientConfigModal(server_url=sse_url))
@@ -6,18 +6,34 @@ method, and time range. Supports export to JSON.
 
 from __future__ import annotations
 
-import json as _json
+import asyncio
 import logging
-from typing import Any, Dict, List
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
+from textual.timer import Timer
 from textual.widgets import Button, DataTable, Input, Label, Select, Static
 
+from argus_mcp import _fastjson
+from argus_mcp.tui._timefmt import hms
 from argus_mcp.tui.screens.base import ArgusScreen
 
 logger = logging.getLogger(__name__)
 
+# Events kept in memory; older ones are dropped as new ones arrive.
+_MAX_EVENTS = 10_000
+
+# Idle time after the last filter edit before the table is rebuilt (seconds).
+_FILTER_DEBOUNCE = 0.15
+
+
+def _write_export(path: str, events: List[Dict[str, Any]]) -> None:
+    """Write *events* to *path* as indented JSON."""
+    with open(path, "wb") as f:
+        f.write(_fastjson.dumps(events, indent=True, default=str))
+
 
 class AuditLogScreen(ArgusScreen):
     """Dedicated audit log viewer with filtering and export."""
@@ -32,10 +48,17 @@ class AuditLogScreen(ArgusScreen):
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self._events: List[Dict[str, Any]] = []
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=_MAX_EVENTS)
         self._paused: bool = False
+        self._filter_method: str = "all"
+        # User/server filters, stored lower-cased for substring matching
         self._filter_user: str = ""
         self._filter_server: str = ""
+        self._filter_timer: Optional[Timer] = None
+        # Totals for the rows currently in the table
+        self._shown: int = 0
+        self._errors: int = 0
+        self._denied: int = 0
 
     def compose_content(self) -> ComposeResult:
         with Vertical(id="audit-layout"):
@@ -87,7 +110,10 @@ class AuditLogScreen(ArgusScreen):
         events = getattr(app, "_last_events", None)
         if events is not None:
             event_list = getattr(events, "events", [])
-            self._events = [e.model_dump() if hasattr(e, "model_dump") else e for e in event_list]
+            self._events.clear()
+            self._events.extend(
+                e.model_dump() if hasattr(e, "model_dump") else e for e in event_list
+            )
         self._refresh_table()
 
     def _refresh_table(self) -> None:
@@ -95,81 +121,90 @@ class AuditLogScreen(ArgusScreen):
         try:
             table = self.query_one("#audit-table", DataTable)
             table.clear()
+            self._shown = self._errors = self._denied = 0
 
-            filtered = self._apply_filters(self._events)
-            errors = 0
-            denied = 0
-
-            for evt in filtered:
-                ts = str(evt.get("timestamp", ""))
-                if "T" in ts:
-                    ts = ts.split("T")[1][:8]
-                user = evt.get("user", "—")
-                method = evt.get("method", evt.get("type", "—"))
-                tool = evt.get("tool", evt.get("name", "—"))
-                server = evt.get("server", evt.get("backend", "—"))
-                latency = evt.get("latency_ms", evt.get("duration_ms"))
-                lat_str = f"{latency:.0f}" if latency else "—"
-                status = evt.get("status", "ok")
-
-                if status in ("error", "failed"):
-                    errors += 1
-                    status_display = f"[red]✕ {status}[/red]"
-                elif status == "denied":
-                    denied += 1
-                    status_display = "[yellow]⚠ denied[/yellow]"
-                else:
-                    status_display = "[green]✓[/green]"
-
-                table.add_row(ts, user, method, tool, server, lat_str, status_display)
-
-            stats = f"Events: {len(filtered)}  │  Errors: {errors}  │  Denied: {denied}"
-            self.query_one("#audit-stats", Static).update(stats)
+            for evt in self._apply_filters(self._events):
+                self._add_row(table, evt)
+
+            self._update_stats()
         except Exception:
             logger.debug("Cannot refresh audit table", exc_info=True)
 
-    def _apply_filters(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _add_row(self, table: DataTable, evt: Dict[str, Any]) -> None:
+        """Append one (already filtered) event to *table* and count it."""
+        ts = hms(str(evt.get("timestamp", "")))
+        user = evt.get("user", "—")
+        method = evt.get("method", evt.get("type", "—"))
+        tool = evt.get("tool", evt.get("name", "—"))
+        server = evt.get("server", evt.get("backend", "—"))
+        latency = evt.get("latency_ms", evt.get("duration_ms"))
+        lat_str = f"{latency:.0f}" if latency else "—"
+        status = evt.get("status", "ok")
+
+        if status in ("error", "failed"):
+            self._errors += 1
+            status_display = f"[red]✕ {status}[/red]"
+        elif status == "denied":
+            self._denied += 1
+            status_display = "[yellow]⚠ denied[/yellow]"
+        else:
+            status_display = "[green]✓[/green]"
+
+        table.add_row(ts, user, method, tool, server, lat_str, status_display)
+        self._shown += 1
+
+    def _update_stats(self) -> None:
+        self.query_one("#audit-stats", Static).update(
+            f"Events: {self._shown}  │  Errors: {self._errors}  │  Denied: {self._denied}"
+        )
+
+    def _filter_criteria(self) -> Tuple[Optional[str], str, str]:
+        """Return the active ``(method, user, server)`` filters, lower-cased."""
+        method = self._filter_method if self._filter_method != "all" else None
+        return method, self._filter_user, self._filter_server
+
+    @staticmethod
+    def _matches(evt: Dict[str, Any], method: Optional[str], user_q: str, server_q: str) -> bool:
+        """Return *True* if *evt* passes the method/user/server filters."""
+        if method is not None and evt.get("method", evt.get("type")) != method:
+            return False
+        if user_q and user_q not in (evt.get("user", "") or "").lower():
+            return False
+        if (
+            server_q
+            and server_q not in (evt.get("server", "") or evt.get("backend", "") or "").lower()
+        ):
+            return False
+        return True
+
+    def _apply_filters(self, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Apply user/server/method filters."""
-        result = events
-
-        # Method filter
-        try:
-            method_sel = self.query_one("#audit-method-filter", Select)
-            method_val = method_sel.value
-            if method_val and method_val != "all":
-                result = [e for e in result if e.get("method", e.get("type")) == method_val]
-        except Exception:
-            pass
-
-        # User filter
-        if self._filter_user:
-            q = self._filter_user.lower()
-            result = [e for e in result if q in (e.get("user", "") or "").lower()]
-
-        # Server filter
-        if self._filter_server:
-            q = self._filter_server.lower()
-            result = [
-                e
-                for e in result
-                if q in (e.get("server", "") or e.get("backend", "") or "").lower()
-            ]
-
-        return result
+        method, user_q, server_q = self._filter_criteria()
+        if method is None and not user_q and not server_q:
+            return list(events)
+        return [e for e in events if self._matches(e, method, user_q, server_q)]
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Update filter when user/server inputs change."""
         if event.input.id == "audit-user-filter":
-            self._filter_user = event.value.strip()
-            self._refresh_table()
+            self._filter_user = event.value.strip().lower()
+            self._schedule_refresh()
         elif event.input.id == "audit-server-filter":
-            self._filter_server = event.value.strip()
-            self._refresh_table()
+            self._filter_server = event.value.strip().lower()
+            self._schedule_refresh()
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Re-filter when method dropdown changes."""
         if event.select.id == "audit-method-filter":
-            self._refresh_table()
+            value = event.value
+            self._filter_method = str(value) if value else "all"
+            self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Rebuild the table once filter edits pause for :data:`_FILTER_DEBOUNCE`."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(_FILTER_DEBOUNCE, self._refresh_table)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-audit-pause":
@@ -181,8 +216,19 @@ class AuditLogScreen(ArgusScreen):
         """Append a new audit event (called from app polling)."""
         if self._paused:
             return
+        evicting = len(self._events) == self._events.maxlen
         self._events.append(event)
-        self._refresh_table()
+        if evicting:
+            # The oldest event was dropped; its row goes with the next rebuild
+            self._schedule_refresh()
+            return
+        if not self._matches(event, *self._filter_criteria()):
+            return
+        try:
+            self._add_row(self.query_one("#audit-table", DataTable), event)
+            self._update_stats()
+        except Exception:
+            logger.debug("Cannot append audit row", exc_info=True)
 
     def action_focus_search(self) -> None:
         try:
@@ -207,10 +253,13 @@ class AuditLogScreen(ArgusScreen):
     def action_export_log(self) -> None:
         """Export visible events as JSON to a file."""
         filtered = self._apply_filters(self._events)
+        self.run_worker(self._export(filtered), group="audit-export", name="audit-export")
+
+    async def _export(self, filtered: List[Dict[str, Any]]) -> None:
+        """Encode and write *filtered* in a worker thread, then report the result."""
         try:
             path = "audit_export.json"
-            with open(path, "w") as f:
-                _json.dump(filtered, f, indent=2, default=str)
+            await asyncio.to_thread(_write_export, path, filtered)
             self.notify(
                 f"Exported {len(filtered)} events to {path}", title="Export", severity="information"
             )
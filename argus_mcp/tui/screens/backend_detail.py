@@ -7,13 +7,16 @@ Launched by pressing Enter on a backend row in the Dashboard.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.screen import ModalScreen
 from textual.widgets import Button, DataTable, Label, Static
 
+from argus_mcp.tui._timefmt import hms
+
 # Phase → (icon, color)
 _PHASE_STYLE: Dict[str, tuple] = {
     "pending": ("◌", "dim"),
@@ -24,6 +27,30 @@ _PHASE_STYLE: Dict[str, tuple] = {
     "shutting_down": ("◑", "cyan"),
 }
 
+# Transport type → colour
+_TRANSPORT_COLORS: Dict[str, str] = {
+    "stdio": "cyan",
+    "sse": "yellow",
+    "streamable-http": "green",
+    "streamable_http": "green",
+}
+
+
+@lru_cache(maxsize=16)
+def _phase_badge(phase: str) -> str:
+    """Return the coloured ``icon Phase`` markup for *phase*."""
+    icon, color = _PHASE_STYLE.get(phase, ("?", "dim"))
+    return f"[{color}]{icon} {phase.title()}[/{color}]"
+
+
+def _condition_row(c: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Return the ``(time, type, status, message)`` table cells for a condition."""
+    ts = hms(str(c.get("timestamp", "")))
+    msg = c.get("message", "")
+    if len(msg) > 60:
+        msg = msg[:57] + "…"
+    return ts, c.get("type", ""), c.get("status", ""), msg
+
 
 class BackendDetailModal(ModalScreen[Optional[str]]):
     """Modal showing full lifecycle detail for a single backend.
@@ -78,28 +105,24 @@ class BackendDetailModal(ModalScreen[Optional[str]]):
     def __init__(self, backend: Dict[str, Any], **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._backend = backend
+        # Styling resolved once; compose() only lays out
+        self._badge = _phase_badge(backend.get("phase", "pending"))
+        self._transport = backend.get("type", "unknown")
+        self._transport_color = _TRANSPORT_COLORS.get(self._transport, "white")
 
     def compose(self) -> ComposeResult:
         b = self._backend
-        phase = b.get("phase", "pending")
-        icon, color = _PHASE_STYLE.get(phase, ("?", "dim"))
         name = b.get("name", "unknown")
 
         with Vertical(id="backend-detail-dialog"):
             yield Label(
-                f"[b]{name}[/b]  [{color}]{icon} {phase.title()}[/{color}]",
+                f"[b]{name}[/b]  {self._badge}",
                 id="backend-detail-title",
             )
 
             # Metadata
-            transport = b.get("type", "unknown")
-            transport_colors = {
-                "stdio": "cyan",
-                "sse": "yellow",
-                "streamable-http": "green",
-                "streamable_http": "green",
-            }
-            tc = transport_colors.get(transport, "white")
+            transport = self._transport
+            tc = self._transport_color
             meta_lines = [
                 f"Transport: [{tc}]{transport}[/{tc}]",
                 f"Group: {b.get('group', '—')}",
@@ -126,8 +149,7 @@ class BackendDetailModal(ModalScreen[Optional[str]]):
             # Labels
             labels = b.get("labels", {})
             if labels:
-                lbl_parts = [f"{k}={v}" for k, v in labels.items()]
-                meta_lines.append(f"Labels: {', '.join(lbl_parts)}")
+                meta_lines.append("Labels: " + ", ".join(f"{k}={v}" for k, v in labels.items()))
 
             yield Static("\n".join(meta_lines), id="backend-detail-meta")
 
@@ -142,12 +164,12 @@ class BackendDetailModal(ModalScreen[Optional[str]]):
                     if h_status == "healthy"
                     else "red" if h_status == "unhealthy" else "yellow"
                 )
-                h_lines = [
-                    f"[b]Health:[/b] [{h_color}]{h_status}[/{h_color}]",
-                    f"Latency: {f'{latency:.0f}ms' if latency else '—'}",
+                yield Static(
+                    f"[b]Health:[/b] [{h_color}]{h_status}[/{h_color}]\n"
+                    f"Latency: {f'{latency:.0f}ms' if latency else '—'}\n"
                     f"Last check: {last_check}",
-                ]
-                yield Static("\n".join(h_lines), id="backend-detail-health")
+                    id="backend-detail-health",
+                )
 
             # Conditions log
             conditions = b.get("conditions", [])
@@ -171,16 +193,7 @@ class BackendDetailModal(ModalScreen[Optional[str]]):
             table = self.query_one("#backend-detail-conditions", DataTable)
             table.add_columns("Time", "Type", "Status", "Message")
             table.cursor_type = "row"
-            for c in conditions:
-                ts = str(c.get("timestamp", ""))
-                if "T" in ts:
-                    ts = ts.split("T")[1][:8]  # HH:MM:SS
-                ctype = c.get("type", "")
-                cstatus = c.get("status", "")
-                msg = c.get("message", "")
-                if len(msg) > 60:
-                    msg = msg[:57] + "…"
-                table.add_row(ts, ctype, cstatus, msg)
+            table.add_rows(_condition_row(c) for c in conditions)
         except Exception:
             pass
 
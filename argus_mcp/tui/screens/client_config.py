@@ -9,44 +9,110 @@ from __future__ import annotations
 import json as _json
 import logging
 import os
+import shutil
+import subprocess
+import time
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Label, OptionList, Static, TextArea
 
+from argus_mcp import _fastjson
+from argus_mcp._fileio import write_atomic
+
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True, slots=True)
+class _ClientConfig:
+    """A known MCP client config file and, once detected, its on-disk state."""
+
+    name: str
+    path: str  # as displayed, with ``~``
+    key: str  # top-level key holding the server map
+    expanded_path: str = ""
+    exists: bool = False
+    parent_exists: bool = False
+
+
 # Known MCP client config locations
-_CLIENT_CONFIGS: List[Dict[str, str]] = [
-    {
-        "name": "VS Code (GitHub Copilot)",
-        "path": "~/.vscode/settings.json",
-        "key": "mcpServers",
-    },
-    {
-        "name": "Cursor",
-        "path": "~/.cursor/mcp.json",
-        "key": "mcpServers",
-    },
-    {
-        "name": "Claude Code",
-        "path": "~/.claude/claude_desktop_config.json",
-        "key": "mcpServers",
-    },
-    {
-        "name": "Claude Desktop",
-        "path": "~/Library/Application Support/Claude/claude_desktop_config.json",
-        "key": "mcpServers",
-    },
-    {
-        "name": "Windsurf",
-        "path": "~/.codeium/windsurf/mcp.json",
-        "key": "mcpServers",
-    },
-]
+_CLIENT_CONFIGS: Tuple[_ClientConfig, ...] = (
+    _ClientConfig("VS Code (GitHub Copilot)", "~/.vscode/settings.json", "mcpServers"),
+    _ClientConfig("Cursor", "~/.cursor/mcp.json", "mcpServers"),
+    _ClientConfig("Claude Code", "~/.claude/claude_desktop_config.json", "mcpServers"),
+    _ClientConfig(
+        "Claude Desktop",
+        "~/Library/Application Support/Claude/claude_desktop_config.json",
+        "mcpServers",
+    ),
+    _ClientConfig("Windsurf", "~/.codeium/windsurf/mcp.json", "mcpServers"),
+)
+
+# Output of ``json.dumps(..., indent=2)`` for the fixed snippet shape; only the
+# (JSON-encoded) config key and URL vary
+_SNIPPET_TEMPLATE = """\
+{{
+  {key}: {{
+    "argus-mcp": {{
+      "url": {url},
+      "transport": "sse"
+    }}
+  }}
+}}"""
+
+# Option-list glyph indexed by whether the client's config file exists
+_EXISTS_GLYPH = ("○", "●")
+
+# Seconds a cached directory listing stays valid
+_DETECT_TTL = 2.0
+
+
+@lru_cache(maxsize=1)
+def _expanded_client_configs() -> Tuple[_ClientConfig, ...]:
+    """Return :data:`_CLIENT_CONFIGS` with ``~`` expanded, computed once."""
+    return tuple(
+        replace(cfg, expanded_path=os.path.expanduser(cfg.path)) for cfg in _CLIENT_CONFIGS
+    )
+
+
+@lru_cache(maxsize=32)
+def _dir_names(parent: str, bucket: int) -> Optional[FrozenSet[str]]:
+    """Names in *parent* (``None`` if unreadable), memoised per :data:`_DETECT_TTL` *bucket*.
+
+    Candidates sharing a directory are resolved from one ``scandir``
+    instead of a ``stat`` each.
+    """
+    try:
+        with os.scandir(parent) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return None
+
+
+# Clipboard helpers tried in order: (executable, extra arguments)
+_CLIPBOARD_TOOLS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("xclip", ("-selection", "clipboard")),
+    ("wl-copy", ()),
+    ("pbcopy", ()),
+)
+
+
+@lru_cache(maxsize=1)
+def _clipboard_command() -> Optional[Tuple[str, ...]]:
+    """Return the argv of the first clipboard helper on ``PATH``, or ``None``.
+
+    Resolved once; the absolute path skips the ``PATH`` search on each copy.
+    """
+    for tool, args in _CLIPBOARD_TOOLS:
+        path = shutil.which(tool)
+        if path is not None:
+            return (path, *args)
+    return None
 
 
 class ClientConfigModal(ModalScreen[Optional[str]]):
@@ -97,8 +163,12 @@ class ClientConfigModal(ModalScreen[Optional[str]]):
     def __init__(self, server_url: str = "", **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._server_url = server_url
-        self._detected: List[Dict[str, Any]] = []
+        self._detected: List[_ClientConfig] = []
         self._selected_index: int = 0
+        # client config key → rendered snippet (the server URL is fixed per modal)
+        self._snippet_cache: Dict[str, str] = {}
+        # Text currently loaded in the preview, to skip identical reloads
+        self._preview_text = ""
 
     def compose(self) -> ComposeResult:
         with Vertical(id="client-config-dialog"):
@@ -119,11 +189,16 @@ class ClientConfigModal(ModalScreen[Optional[str]]):
     def on_mount(self) -> None:
         """Detect installed clients and populate list."""
         self._detect_clients()
+        self._preview = self.query_one("#client-preview", TextArea)
         try:
             option_list = self.query_one("#client-list", OptionList)
-            for client in self._detected:
-                status = "●" if client["exists"] else "○"
-                option_list.add_option(f"{status} {client['name']}  {client['path']}")
+            # One add_options call refreshes the list once, not per client
+            option_list.add_options(
+                [
+                    f"{_EXISTS_GLYPH[client.exists]} {client.name}  {client.path}"
+                    for client in self._detected
+                ]
+            )
             if self._detected:
                 self._update_preview(0)
         except Exception:
@@ -131,30 +206,37 @@ class ClientConfigModal(ModalScreen[Optional[str]]):
 
     def _detect_clients(self) -> None:
         """Check which client config files exist."""
-        self._detected = []
-        for cfg in _CLIENT_CONFIGS:
-            expanded = os.path.expanduser(cfg["path"])
-            self._detected.append(
-                {
-                    "name": cfg["name"],
-                    "path": cfg["path"],
-                    "expanded_path": expanded,
-                    "key": cfg["key"],
-                    "exists": Path(expanded).exists(),
-                }
+        bucket = int(time.monotonic() // _DETECT_TTL)
+        detected = []
+        for cfg in _expanded_client_configs():
+            parent, name = os.path.split(cfg.expanded_path)
+            names = _dir_names(parent, bucket)
+            detected.append(
+                _ClientConfig(
+                    cfg.name,
+                    cfg.path,
+                    cfg.key,
+                    cfg.expanded_path,
+                    exists=names is not None and name in names,
+                    parent_exists=names is not None,
+                )
             )
+        self._detected = detected
 
-    def _generate_config(self, client: Dict[str, Any]) -> str:
-        """Generate the MCP config snippet for a client."""
-        config = {
-            client["key"]: {
-                "argus-mcp": {
-                    "url": self._server_url,
-                    "transport": "sse",
-                }
-            }
-        }
-        return _json.dumps(config, indent=2)
+    @staticmethod
+    def _invalidate_detect_cache() -> None:
+        """Forget cached directory listings (e.g. after writing a config file)."""
+        _dir_names.cache_clear()
+
+    def _generate_config(self, client: _ClientConfig) -> str:
+        """Generate the MCP config snippet for a client (cached per config key)."""
+        key = client.key
+        snippet = self._snippet_cache.get(key)
+        if snippet is None:
+            snippet = self._snippet_cache[key] = _SNIPPET_TEMPLATE.format(
+                key=_json.dumps(key), url=_json.dumps(self._server_url)
+            )
+        return snippet
 
     def _update_preview(self, index: int) -> None:
         """Update the preview pane for the selected client."""
@@ -162,8 +244,11 @@ class ClientConfigModal(ModalScreen[Optional[str]]):
             self._selected_index = index
             client = self._detected[index]
             snippet = self._generate_config(client)
+            if snippet == self._preview_text:
+                return
             try:
-                self.query_one("#client-preview", TextArea).load_text(snippet)
+                self._preview.load_text(snippet)
+                self._preview_text = snippet
             except Exception:
                 pass
 
@@ -185,29 +270,32 @@ class ClientConfigModal(ModalScreen[Optional[str]]):
         if not self._detected:
             return
         client = self._detected[self._selected_index]
-        path = client["expanded_path"]
+        path = client.expanded_path
 
         try:
-            existing = {}
-            if Path(path).exists():
-                with open(path) as f:
-                    existing = _json.load(f)
+            try:
+                with open(path, "rb") as f:
+                    existing: Dict[str, Any] = _fastjson.loads(f.read())
+            except FileNotFoundError:
+                existing = {}
+                # Detection already listed the parent when it exists
+                if not client.parent_exists:
+                    Path(path).parent.mkdir(parents=True, exist_ok=True)
 
-            # Merge the mcpServers section
-            key = client["key"]
+            # Merge the mcpServers section and encode before touching the file,
+            # so a failure here leaves the existing config intact
+            key = client.key
             if key not in existing:
                 existing[key] = {}
             existing[key]["argus-mcp"] = {
                 "url": self._server_url,
                 "transport": "sse",
             }
-
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w") as f:
-                _json.dump(existing, f, indent=2)
+            write_atomic(path, _fastjson.dumps(existing, indent=True))
+            self._invalidate_detect_cache()
 
             self.notify(
-                f"Written to {client['path']}",
+                f"Written to {client.path}",
                 title="Config Exported",
                 severity="information",
             )
@@ -221,12 +309,17 @@ class ClientConfigModal(ModalScreen[Optional[str]]):
             return
         client = self._detected[self._selected_index]
         snippet = self._generate_config(client)
-        # Textual doesn't have native clipboard; copy via app
+        # Textual doesn't have native clipboard; copy via an external helper
+        command = _clipboard_command()
+        if command is None:
+            self.notify(
+                "Copy to clipboard failed — no xclip, wl-copy or pbcopy found",
+                severity="warning",
+            )
+            return
         try:
-            import subprocess
-
             proc = subprocess.run(
-                ["xclip", "-selection", "clipboard"],
+                command,
                 input=snippet.encode(),
                 capture_output=True,
                 timeout=2,
@@ -234,7 +327,7 @@ class ClientConfigModal(ModalScreen[Optional[str]]):
             if proc.returncode == 0:
                 self.notify("Copied to clipboard!", title="Copy", severity="information")
             else:
-                self.notify("Copy to clipboard failed — xclip not available", severity="warning")
+                self.notify("Copy to clipboard failed", severity="warning")
         except Exception:
             self.notify("Clipboard not available. Config shown in preview.", severity="warning")
 
@@ -22,9 +22,12 @@ from argus_mcp.tui.widgets.server_selector import ServerSelectorWidget
 class DashboardScreen(ArgusScreen):
     """Main dashboard screen."""
 
+    # Set on first show; later shows skip the app-level initialization
+    _ds_init_done = False
+
     def on_show(self) -> None:
         """Trigger app-level initialization once the screen is shown."""
-        if getattr(self, "_ds_init_done", False):
+        if self._ds_init_done:
             return
         self._ds_init_done = True
         app = self.app
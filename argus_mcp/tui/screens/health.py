@@ -6,15 +6,27 @@ Dashboard stays clean.
 
 from __future__ import annotations
 
+import time
+from typing import TYPE_CHECKING, Sequence, cast
+
+from textual import work
 from textual.app import ComposeResult
 from textual.widgets import TabbedContent, TabPane
 
+from argus_mcp.server.management.schemas import BackendDetail
 from argus_mcp.tui.screens.base import ArgusScreen
 from argus_mcp.tui.widgets.health_panel import HealthPanel
 from argus_mcp.tui.widgets.server_groups import ServerGroupsWidget
 from argus_mcp.tui.widgets.sessions_panel import SessionsPanel
 from argus_mcp.tui.widgets.version_drift import VersionDriftPanel
 
+if TYPE_CHECKING:
+    from argus_mcp.tui.api_client import ApiClient
+    from argus_mcp.tui.app import ArgusApp
+
+# Seconds the app's last polled backend details are used instead of a fetch
+_BACKENDS_TTL = 5.0
+
 
 class HealthScreen(ArgusScreen):
     """Health monitoring mode — per-backend status, sessions, versions."""
@@ -30,38 +42,55 @@ class HealthScreen(ArgusScreen):
             with TabPane("Server Groups", id="tab-health-groups"):
                 yield ServerGroupsWidget(id="server-groups-widget")
 
+    def on_mount(self) -> None:
+        self._health_panel = self.query_one(HealthPanel)
+        self._server_groups = self.query_one(ServerGroupsWidget)
+
     def on_show(self) -> None:
         """Refresh health data from cached app state."""
         self._refresh_from_app()
 
     def _refresh_from_app(self) -> None:
-        """Pull latest backend data from the app cache into widgets."""
-        app = self.app
-        last_status = getattr(app, "_last_status", None)
-        if last_status is None:
+        """Pull latest backend data from the app cache into widgets.
+
+        Backend details polled within the last :data:`_BACKENDS_TTL`
+        seconds are shown directly; otherwise they are fetched.
+        """
+        app = cast("ArgusApp", self.app)
+        if app._last_status is None:
+            return
+
+        details = app._last_backends
+        if details is not None and time.monotonic() - app._last_backends_at < _BACKENDS_TTL:
+            self._show_backends(details)
             return
 
         # Feed backends into health panel + server groups
-        mgr = getattr(app, "_server_manager", None)
+        mgr = app._server_manager
         if mgr is None:
             return
-        client = getattr(mgr, "active_client", None)
+        client = mgr.active_client
         if client is None:
             return
 
-        async def _fetch() -> None:
-            try:
-                backends_resp = await client.get_backends()
-                details = [b.model_dump() for b in backends_resp.backends]
-                try:
-                    self.query_one(HealthPanel).update_from_backends(details)
-                except Exception:
-                    pass
-                try:
-                    self.query_one(ServerGroupsWidget).update_groups(details)
-                except Exception:
-                    pass
-            except Exception:
-                pass
-
-        app.run_worker(_fetch(), exclusive=False, name="health-refresh")
+        self._fetch_health(client)
+
+    @work(exclusive=True, group="health-refresh")
+    async def _fetch_health(self, client: ApiClient) -> None:
+        """Fetch backend details from *client* and show them."""
+        try:
+            backends_resp = await client.get_backends()
+        except Exception:
+            return
+        self._show_backends(backends_resp.backends)
+
+    def _show_backends(self, details: Sequence[BackendDetail]) -> None:
+        """Feed backend *details* into the health panel and server groups."""
+        try:
+            self._health_panel.update_from_backends(details)
+        except Exception:
+            pass
+        try:
+            self._server_groups.update_groups(details)
+        except Exception:
+            pass
@@ -13,18 +13,22 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import re
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
 
 import yaml  # type: ignore[import-untyped]
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Static
 
+from argus_mcp._yaml import YAML_DUMPER, YAML_LOADER
 from argus_mcp.registry.cache import RegistryCache
 from argus_mcp.registry.client import RegistryClient
 from argus_mcp.registry.models import ServerEntry
 from argus_mcp.tui.screens.base import ArgusScreen
 from argus_mcp.tui.screens.server_detail import ServerDetailModal
+from argus_mcp.tui.settings import load_settings
 from argus_mcp.tui.widgets.install_panel import InstallConfirmed, InstallPanelWidget
 from argus_mcp.tui.widgets.registry_browser import (
     InstallRequested,
@@ -32,14 +36,110 @@ from argus_mcp.tui.widgets.registry_browser import (
     ServerSelected,
 )
 
+if TYPE_CHECKING:
+    from argus_mcp.tui.app import ArgusApp
+
 logger = logging.getLogger(__name__)
 
+# Top-level ``backends:`` key opening a block mapping
+_BACKENDS_HEADER_RE = re.compile(r"backends:[ \t]*(?:#.*)?\r?\n?$")
+
+# Seconds a fetched catalog is reused when the Registry mode is re-entered
+_CATALOG_TTL = 60.0
+
+
+def _find_config_file(status_path: Optional[str]) -> Optional[str]:
+    """Return *status_path* if it is a file, else a ``config.yaml``/``.yml`` in the CWD."""
+    if status_path and os.path.isfile(status_path):
+        return status_path
+    for name in ("config.yaml", "config.yml"):
+        candidate = os.path.join(os.getcwd(), name)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _insert_backend_text(
+    text: str, backend_name: str, backend_config: Dict[str, Any]
+) -> Optional[str]:
+    """Return *text* with the backend appended to its ``backends:`` block.
+
+    Only the new entry is serialised; the rest of the document (comments
+    included) is kept verbatim.  Returns ``None`` when there is no single
+    top-level block-style ``backends:`` mapping with entries to extend.
+    """
+    lines = text.splitlines(keepends=True)
+    headers = [i for i, line in enumerate(lines) if _BACKENDS_HEADER_RE.match(line)]
+    if len(headers) != 1:
+        return None
+
+    # The block runs until the next top-level key; new lines go after its
+    # last indented line, at the indentation of its first entry
+    indent = None
+    last = None
+    for i in range(headers[0] + 1, len(lines)):
+        line = lines[i]
+        content = line.strip()
+        if not content:
+            continue
+        if not line[0].isspace():
+            if content.startswith("#"):
+                continue  # unindented comment inside the block
+            break  # next top-level key
+        if indent is None and not content.startswith("#"):
+            indent = line[: len(line) - len(line.lstrip())]
+        last = i
+    if indent is None or last is None:
+        return None
+
+    fragment = yaml.dump(
+        {backend_name: backend_config},
+        Dumper=YAML_DUMPER,
+        default_flow_style=False,
+        sort_keys=False,
+    )
+    block = "".join(indent + line for line in fragment.splitlines(keepends=True))
+    if not lines[last].endswith("\n"):
+        lines[last] += "\n"
+    lines.insert(last + 1, block)
+    return "".join(lines)
+
+
+def _add_backend_to_config(
+    config_path: str, backend_name: str, backend_config: Dict[str, Any]
+) -> bool:
+    """Add a backend entry to the YAML config file (blocking).
+
+    Returns ``False`` without writing if *backend_name* already exists.
+    When possible only the new entry is serialised and spliced into the
+    existing ``backends:`` block; the edited text is re-parsed to confirm
+    it, and the whole document is re-dumped otherwise.
+    """
+    with open(config_path, "r", encoding="utf-8") as fh:
+        text = fh.read()
+    data = yaml.load(text, Loader=YAML_LOADER) or {}
+
+    backends: Dict[str, Any] = data.setdefault("backends", {})
+    if backend_name in backends:
+        return False
+
+    backends[backend_name] = backend_config
+
+    new_text = _insert_backend_text(text, backend_name, backend_config)
+    if new_text is None or yaml.load(new_text, Loader=YAML_LOADER) != data:
+        new_text = yaml.dump(data, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
+
+    with open(config_path, "w", encoding="utf-8") as fh:
+        fh.write(new_text)
+    return True
+
 
 class RegistryScreen(ArgusScreen):
     """Registry mode — server browser and install panel.
 
-    On mount, fetches the server catalog from configured registries
-    (with cache fallback) and populates the browser widget.
+    Each time the mode is entered, fetches the server catalog from
+    configured registries (with cache fallback) and populates the browser
+    widget; a catalog fetched within the last minute is reused.
     """
 
     def __init__(self, **kwargs: Any) -> None:
@@ -58,16 +158,44 @@ class RegistryScreen(ArgusScreen):
                 yield InstallPanelWidget(id="install-panel")
 
     def on_mount(self) -> None:
-        """Kick off async registry fetch."""
-        self._cache = RegistryCache()
-        self._clients: List[RegistryClient] = []
-        self._load_task: asyncio.Task[None] | None = asyncio.create_task(self._load_registry())
+        """Resolve widgets and attach the app-level registry state.
+
+        The cache, HTTP clients and last catalog live on the app so that
+        re-entering the mode reuses them instead of starting cold.
+        """
+        self._browser = self.query_one("#registry-browser", RegistryBrowserWidget)
+        self._install_panel = self.query_one("#install-panel", InstallPanelWidget)
+        self._status_bar = self.query_one("#registry-status-bar", Static)
+
+        app = cast("ArgusApp", self.app)
+        if app._registry_cache is None:
+            app._registry_cache = RegistryCache()
+        if app._registry_clients is None:
+            app._registry_clients = {}
+        self._cache: RegistryCache = app._registry_cache
+        self._clients: Dict[str, RegistryClient] = app._registry_clients
+        # Catalog the browser currently shows; re-entering with it still fresh is a no-op
+        self._shown_catalog: Optional[Tuple[float, Tuple[str, ...], List[ServerEntry]]] = None
+
+    def on_screen_resume(self) -> None:
+        """Load the catalog each time the mode is entered.
+
+        The app's copy is reused while it is fresh.  ``Show`` only fires on
+        the first entry for a mode screen; ``ScreenResume`` fires on every one.
+        """
+        # Screen worker: cancelled with the screen; a newer load replaces one in flight
+        self.run_worker(self._load_registry(), exclusive=True, group="registry-load")
+
+    def _client_for(self, url: str) -> RegistryClient:
+        """Return the shared client for *url*, creating it on first use."""
+        client = self._clients.get(url)
+        if client is None:
+            client = self._clients[url] = RegistryClient(url, cache=self._cache)
+        return client
 
     async def _load_registry(self) -> None:
         """Fetch servers from all configured registries."""
-        browser = self.query_one("#registry-browser", RegistryBrowserWidget)
-        browser.set_status("Loading registry…")
-
+        browser = self._browser
         registry_urls = self._get_registry_urls()
 
         if not registry_urls:
@@ -78,18 +206,43 @@ class RegistryScreen(ArgusScreen):
             self._set_status("No registries configured")
             return
 
-        all_entries: List[ServerEntry] = []
-
-        for url in registry_urls:
-            client = RegistryClient(url, cache=self._cache)
-            self._clients.append(client)
+        # A URL listed twice is fetched once
+        registry_urls = list(dict.fromkeys(registry_urls))
+        url_key = tuple(registry_urls)
+        app = cast("ArgusApp", self.app)
+        catalog = app._registry_catalog
+        if (
+            catalog is not None
+            and catalog[1] == url_key
+            and time.monotonic() - catalog[0] < _CATALOG_TTL
+        ):
+            if catalog is self._shown_catalog:
+                return
+            all_entries: List[ServerEntry] = catalog[2]
+            browser.entries = list(all_entries)
+            self._shown_catalog = catalog
+        else:
+            # Fetch every registry concurrently and show each one's servers
+            # as soon as it answers
+            browser.set_status("Loading registry…")
+            browser.entries = []
+            all_entries = []
+            fetches = [asyncio.ensure_future(self._fetch_servers(url)) for url in registry_urls]
             try:
-                page = await client.list_servers()
-                all_entries.extend(page.servers)
-            except Exception as exc:
-                logger.warning("Failed to fetch registry %s: %s", url, exc)
+                for fetched in asyncio.as_completed(fetches):
+                    servers = await fetched
+                    if servers:
+                        all_entries.extend(servers)
+                        browser.extend_entries(servers)
+                        browser.set_status(f"Loaded {len(all_entries)} servers so far…")
+            finally:
+                # Only does anything if this load was cancelled part-way
+                for fetch in fetches:
+                    fetch.cancel()
+            if all_entries:
+                app._registry_catalog = (time.monotonic(), url_key, all_entries)
+                self._shown_catalog = app._registry_catalog
 
-        browser.entries = all_entries
         status_msg = (
             f"Loaded {len(all_entries)} servers from {len(registry_urls)} registries"
             if all_entries
@@ -98,6 +251,15 @@ class RegistryScreen(ArgusScreen):
         browser.set_status(status_msg)
         self._set_status(status_msg)
 
+    async def _fetch_servers(self, url: str) -> List[ServerEntry]:
+        """Return the servers listed by the registry at *url* ([] on failure)."""
+        try:
+            page = await self._client_for(url).list_servers()
+        except Exception as exc:
+            logger.warning("Failed to fetch registry %s: %s", url, exc)
+            return []
+        return page.servers
+
     def _get_registry_urls(self) -> List[str]:
         """Retrieve configured registry URLs.
 
@@ -110,8 +272,6 @@ class RegistryScreen(ArgusScreen):
 
         # 1. Try config.yaml registries (loaded at server startup)
         try:
-            from argus_mcp.tui.settings import load_settings
-
             settings = load_settings()
             cfg_registries = settings.get("registries", [])
             if cfg_registries:
@@ -136,7 +296,7 @@ class RegistryScreen(ArgusScreen):
     def _set_status(self, text: str) -> None:
         """Update the status bar below the header."""
         try:
-            self.query_one("#registry-status-bar", Static).update(text)
+            self._status_bar.update(text)
         except Exception:
             pass
 
@@ -144,8 +304,9 @@ class RegistryScreen(ArgusScreen):
 
     def on_server_selected(self, event: ServerSelected) -> None:
         """Update the install panel when a server is highlighted."""
-        panel = self.query_one("#install-panel", InstallPanelWidget)
-        panel.selected_entry = event.entry
+        # Handled here; the app's on_server_selected expects the selector's message
+        event.stop()
+        self._install_panel.selected_entry = event.entry
 
     def on_install_requested(self, event: InstallRequested) -> None:
         """Handle Enter key on a server row — open detail modal."""
@@ -168,11 +329,17 @@ class RegistryScreen(ArgusScreen):
         entry: ServerEntry,
         config: Dict[str, Any],
     ) -> None:
-        """Shared install logic for both panel and modal flows."""
+        """Shared install logic for both panel and modal flows.
+
+        The config file is located and rewritten in a worker thread so a
+        large config does not stall the UI.
+        """
         logger.info("Install confirmed: %s → %s", name, json.dumps(config))
+        self.run_worker(self._install(name, config), group="registry-install")
 
+    async def _install(self, name: str, config: Dict[str, Any]) -> None:
         # Write to config file
-        config_path = self._resolve_config_path()
+        config_path = await self._resolve_config_path()
         if config_path is None:
             self.notify(
                 "Cannot determine config file path. Add manually.",
@@ -181,7 +348,7 @@ class RegistryScreen(ArgusScreen):
             )
             return
 
-        success = self._write_backend_to_config(config_path, name, config)
+        success = await self._write_backend_to_config(config_path, name, config)
         if not success:
             return
 
@@ -195,52 +362,39 @@ class RegistryScreen(ArgusScreen):
         # Trigger config hot-reload via the management API
         self._trigger_reload()
 
-    def _resolve_config_path(self) -> Optional[str]:
-        """Find the config file path from server status or defaults."""
-        app = self.app
-        status = getattr(app, "_last_status", None)
-        if status is not None:
-            path = getattr(status.config, "file_path", None)
-            if path and os.path.isfile(path):
-                return path
-
-        # Fallback: search for config.yaml in CWD
-        for name in ("config.yaml", "config.yml"):
-            candidate = os.path.join(os.getcwd(), name)
-            if os.path.isfile(candidate):
-                return candidate
+    async def _resolve_config_path(self) -> Optional[str]:
+        """Find the config file path from server status or defaults.
 
-        return None
+        Falls back to ``config.yaml`` in the CWD; the file checks run in a
+        worker thread.
+        """
+        status = getattr(self.app, "_last_status", None)
+        status_path = getattr(status.config, "file_path", None) if status is not None else None
+        return await asyncio.to_thread(_find_config_file, status_path)
 
-    def _write_backend_to_config(
+    async def _write_backend_to_config(
         self, config_path: str, backend_name: str, backend_config: Dict[str, Any]
     ) -> bool:
         """Append a backend entry to the YAML config file."""
         try:
-            with open(config_path, "r", encoding="utf-8") as fh:
-                data = yaml.safe_load(fh) or {}
-
-            backends: Dict[str, Any] = data.setdefault("backends", {})
-            if backend_name in backends:
-                self.notify(
-                    f"Backend '{backend_name}' already exists in config",
-                    severity="warning",
-                )
-                return False
-
-            backends[backend_name] = backend_config
-
-            with open(config_path, "w", encoding="utf-8") as fh:
-                yaml.dump(data, fh, default_flow_style=False, sort_keys=False)
-
-            logger.info("Wrote backend '%s' to %s", backend_name, config_path)
-            return True
-
+            added = await asyncio.to_thread(
+                _add_backend_to_config, config_path, backend_name, backend_config
+            )
         except Exception as exc:
             logger.error("Failed to write config: %s", exc)
             self.notify(f"Failed to write config: {exc}", severity="error")
             return False
 
+        if not added:
+            self.notify(
+                f"Backend '{backend_name}' already exists in config",
+                severity="warning",
+            )
+            return False
+
+        logger.info("Wrote backend '%s' to %s", backend_name, config_path)
+        return True
+
     def _trigger_reload(self) -> None:
         """Post a config reload request to the server."""
         mgr = getattr(self.app, "_server_manager", None)
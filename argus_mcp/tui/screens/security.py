@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 
+import yaml  # type: ignore[import-untyped]
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import (
@@ -21,6 +22,7 @@ from textual.widgets import (
     TextArea,
 )
 
+from argus_mcp._yaml import YAML_LOADER
 from argus_mcp.tui.screens.base import ArgusScreen
 
 logger = logging.getLogger(__name__)
@@ -150,6 +152,10 @@ class SecurityScreen(ArgusScreen):
 
     # ── Lifecycle ────────────────────────────────────────────────
 
+    def on_mount(self) -> None:
+        self._backend_select = self.query_one("#sec-backend-select", Select)
+        self._policies_editor = self.query_one("#sec-authz-policies-editor", TextArea)
+
     def on_show(self) -> None:
         """Populate backend selector for outgoing auth."""
         self._refresh_security()
@@ -162,7 +168,7 @@ class SecurityScreen(ArgusScreen):
         route_map = getattr(caps, "route_map", {})
         options = [(name, name) for name in sorted(route_map.keys())]
         try:
-            self.query_one("#sec-backend-select", Select).set_options(options)
+            self._backend_select.set_options(options)
         except Exception:
             pass
 
@@ -176,26 +182,18 @@ class SecurityScreen(ArgusScreen):
     def _do_apply_policies(self) -> None:
         """Validate and apply authorization policies."""
         try:
-            editor = self.query_one("#sec-authz-policies-editor", TextArea)
-            text = editor.text.strip()
+            text = self._policies_editor.text.strip()
             if not text or text.startswith("#"):
                 self.notify("No policies to apply", severity="warning")
                 return
             try:
-                import yaml
-
-                data = yaml.safe_load(text)
+                data = yaml.load(text, Loader=YAML_LOADER)
                 policies = data.get("policies", []) if isinstance(data, dict) else []
                 self.notify(
                     f"Parsed {len(policies)} policy rules (save pending)",
                     title="Policies",
                     timeout=4,
                 )
-            except ImportError:
-                self.notify(
-                    "YAML parser not available — install PyYAML",
-                    severity="error",
-                )
             except Exception as exc:
                 self.notify(f"Invalid YAML: {exc}", severity="error")
         except Exception:
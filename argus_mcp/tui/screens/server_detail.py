@@ -145,11 +145,7 @@ class ServerDetailModal(ModalScreen[Optional[Dict[str, Any]]]):
             table = self.query_one("#server-detail-tools-table", DataTable)
             table.add_columns("Name", "Description")
             table.cursor_type = "row"
-            for tool in self._entry.tools:
-                desc = (
-                    tool.description[:60] + "…" if len(tool.description) > 60 else tool.description
-                )
-                table.add_row(tool.name, desc, key=tool.name)
+            table.add_rows((tool.name, tool.short_description) for tool in self._entry.tools)
         except Exception:
             pass
 
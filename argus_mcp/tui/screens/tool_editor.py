@@ -9,6 +9,7 @@ Sub-screen within Settings mode for customizing tools:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from typing import Any, Dict, List, Optional
@@ -25,6 +26,16 @@ from argus_mcp.tui.widgets.tool_preview import ToolPreviewWidget
 logger = logging.getLogger(__name__)
 
 
+def _tool_dicts(caps: Any) -> List[Dict[str, Any]]:
+    """Return the tools of *caps* as dicts, each tagged with its backend."""
+    tools = caps.model_dump(include={"tools"})["tools"]
+    for d in tools:
+        # Map route_map to add backend info
+        route = caps.route_map.get(d.get("name", ""), ("", ""))
+        d["backend"] = route[0] if route else ""
+    return tools
+
+
 class ToolEditorScreen(ArgusScreen):
     """Interactive tool customization screen.
 
@@ -124,14 +135,11 @@ class ToolEditorScreen(ArgusScreen):
         app = self.app
         caps = getattr(app, "_last_caps", None)
         if caps is not None:
-            tools = []
-            for t in caps.tools:
-                d = t.model_dump()
-                # Map route_map to add backend info
-                route = caps.route_map.get(d.get("name", ""), ("", ""))
-                d["backend"] = route[0] if route else ""
-                tools.append(d)
-            self.load_tools(tools)
+            self.run_worker(self._load_caps(caps), exclusive=True, group="editor-caps")
+
+    async def _load_caps(self, caps: Any) -> None:
+        """Convert the tools of *caps* to dicts off the event loop, then load them."""
+        self.load_tools(await asyncio.to_thread(_tool_dicts, caps))
 
     def load_tools(self, tools: List[Dict[str, Any]]) -> None:
         """Load tools into the editor."""
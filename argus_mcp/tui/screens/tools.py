@@ -7,6 +7,7 @@ and a detail panel for inspecting individual tool schemas.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -20,6 +21,12 @@ from argus_mcp.tui.widgets.capability_tables import CapabilitySection
 logger = logging.getLogger(__name__)
 
 
+def _dump_caps(caps: Any) -> Dict[str, List[Dict[str, Any]]]:
+    """Return the tool, resource and prompt lists of *caps* as plain dicts."""
+    # One model_dump() call converts all three lists in pydantic-core
+    return caps.model_dump(include={"tools", "resources", "prompts"})
+
+
 class ToolsScreen(ArgusScreen):
     """Tools mode — capability tables with search, filtering, and detail view."""
 
@@ -36,6 +43,8 @@ class ToolsScreen(ArgusScreen):
         self._cached_resources: List[Dict[str, Any]] = []
         self._cached_prompts: List[Dict[str, Any]] = []
         self._cached_route_map: Optional[Dict] = None
+        # Response the cached dicts were dumped from
+        self._cached_source: Optional[Any] = None
         self._conflicts_only: bool = False
         self._show_filtered: bool = False
 
@@ -58,16 +67,22 @@ class ToolsScreen(ArgusScreen):
         """Re-populate capability tables from app-level cached data."""
         app = self.app
         caps = getattr(app, "_last_caps", None)
-        if caps is not None:
-            tools = [t.model_dump() for t in caps.tools]
-            resources = [r.model_dump() for r in caps.resources]
-            prompts = [p.model_dump() for p in caps.prompts]
-            route_map = caps.route_map
-            self._cached_tools = tools
-            self._cached_resources = resources
-            self._cached_prompts = prompts
-            self._cached_route_map = route_map
+        if caps is None:
+            return
+        if caps is self._cached_source:
             self._populate_tables()
+        else:
+            self.run_worker(self._load_caps(caps), exclusive=True, group="tools-caps")
+
+    async def _load_caps(self, caps: Any) -> None:
+        """Convert *caps* to dicts off the event loop, then fill the tables."""
+        dumped = await asyncio.to_thread(_dump_caps, caps)
+        self._cached_tools = dumped["tools"]
+        self._cached_resources = dumped["resources"]
+        self._cached_prompts = dumped["prompts"]
+        self._cached_route_map = caps.route_map
+        self._cached_source = caps
+        self._populate_tables()
 
     def _populate_tables(self, filtered_tools: Optional[List[Dict[str, Any]]] = None) -> None:
         """Populate capability tables and update conflict status bar."""
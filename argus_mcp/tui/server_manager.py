@@ -7,6 +7,7 @@ currently *active* (i.e. being polled and displayed).
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -64,6 +65,9 @@ class ServerManager:
         self._config_path = config_path or _SERVERS_FILE
         self._servers: Dict[str, ServerEntry] = {}
         self._active_name: Optional[str] = None
+        # Number of entries with ``connected`` set; kept in step by
+        # _set_connected() and _put()/_pop()
+        self._connected_count = 0
 
     # ── Properties ──────────────────────────────────────────────
 
@@ -101,6 +105,34 @@ class ServerManager:
     def count(self) -> int:
         return len(self._servers)
 
+    @property
+    def connected_count(self) -> int:
+        """Number of servers currently marked connected."""
+        return self._connected_count
+
+    # ── Connection-state bookkeeping ────────────────────────────
+
+    def _set_connected(self, entry: ServerEntry, value: bool) -> None:
+        """Set ``entry.connected``, keeping :attr:`connected_count` in step."""
+        if entry.connected != value:
+            entry.connected = value
+            if self._servers.get(entry.name) is entry:
+                self._connected_count += 1 if value else -1
+
+    def _put(self, entry: ServerEntry) -> None:
+        """Store *entry*, replacing any server of the same name."""
+        self._pop(entry.name)
+        self._servers[entry.name] = entry
+        if entry.connected:
+            self._connected_count += 1
+
+    def _pop(self, name: str) -> Optional[ServerEntry]:
+        """Remove and return the server called *name*, if any."""
+        entry = self._servers.pop(name, None)
+        if entry is not None and entry.connected:
+            self._connected_count -= 1
+        return entry
+
     # ── Add / Remove ────────────────────────────────────────────
 
     def add(
@@ -118,7 +150,7 @@ class ServerManager:
         """
         url = url.rstrip("/")
         entry = ServerEntry(name=name, url=url, token=token)
-        self._servers[name] = entry
+        self._put(entry)
 
         if set_active or self._active_name is None:
             self._active_name = name
@@ -131,8 +163,8 @@ class ServerManager:
         if name not in self._servers:
             raise KeyError(f"No server named '{name}'")
 
-        entry = self._servers.pop(name)
-        if entry.client is not None:
+        entry = self._pop(name)
+        if entry is not None and entry.client is not None:
             logger.debug(
                 "Client for '%s' will be orphaned — call close_all() or disconnect() first", name
             )
@@ -163,7 +195,7 @@ class ServerManager:
         client = ApiClient(base_url=entry.url, token=entry.token)
         await client.connect()
         entry.client = client
-        entry.connected = True
+        self._set_connected(entry, True)
         logger.info("Connected to server '%s' at %s", name, entry.url)
 
     async def disconnect(self, name: str) -> None:
@@ -179,7 +211,7 @@ class ServerManager:
                 logger.debug("Error closing client for '%s'", name, exc_info=True)
 
         entry.client = None
-        entry.connected = False
+        self._set_connected(entry, False)
         logger.info("Disconnected from server '%s'", name)
 
     async def connect_all(self) -> Dict[str, Optional[Exception]]:
@@ -194,6 +226,20 @@ class ServerManager:
                 results[name] = exc
         return results
 
+    async def warm_standby(self) -> None:
+        """Pre-open one pooled connection to every non-active connected server.
+
+        Switching to one of them then does not start cold.  Unreachable
+        servers only delay this call, so run it in the background.
+        """
+        warmups = [
+            entry.client.warm(1)
+            for name, entry in self._servers.items()
+            if name != self._active_name and entry.client is not None and entry.connected
+        ]
+        if warmups:
+            await asyncio.gather(*warmups)
+
     async def close_all(self) -> None:
         """Disconnect every server."""
         for name in list(self._servers):
@@ -205,12 +251,12 @@ class ServerManager:
         Used when a poll fails — the client object stays alive for retry.
         """
         if name in self._servers:
-            self._servers[name].connected = False
+            self._set_connected(self._servers[name], False)
 
     def mark_connected(self, name: str) -> None:
         """Mark a server as connected (e.g. after a successful retry)."""
         if name in self._servers:
-            self._servers[name].connected = True
+            self._set_connected(self._servers[name], True)
 
     # ── Persistence ─────────────────────────────────────────────
 
@@ -237,7 +283,7 @@ class ServerManager:
             if not name or not url:
                 continue
             token = srv.get("token")
-            self._servers[name] = ServerEntry(name=name, url=url, token=token)
+            self._put(ServerEntry(name=name, url=url, token=token))
 
         active = data.get("active")
         if active and active in self._servers:
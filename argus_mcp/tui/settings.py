@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -65,28 +65,58 @@ def _default_settings() -> Dict[str, Any]:
     }
 
 
+# Last settings file contents: (st_mtime_ns, st_size, text).  Reused while
+# the file's mtime and size are unchanged, so repeated loads skip the open
+# and read; each load still parses its own copy.
+_cache: Optional[Tuple[int, int, str]] = None
+
+
 def load_settings() -> Dict[str, Any]:
-    """Load settings from disk, returning defaults if missing/corrupt."""
+    """Load settings from disk, returning defaults if missing/corrupt.
+
+    The result is a private copy that callers may mutate; pass it to
+    :func:`save_settings` to persist changes.
+    """
+    global _cache
     defaults = _default_settings()
     try:
-        with open(_SETTINGS_FILE, encoding="utf-8") as fh:
-            data = json.load(fh)
+        st = os.stat(_SETTINGS_FILE)
+    except FileNotFoundError:
+        _cache = None
+        return defaults
+    except OSError:
+        logger.debug("Could not load settings, using defaults", exc_info=True)
+        return defaults
+    try:
+        if _cache is not None and _cache[0] == st.st_mtime_ns and _cache[1] == st.st_size:
+            text = _cache[2]
+        else:
+            with open(_SETTINGS_FILE, encoding="utf-8") as fh:
+                text = fh.read()
+            _cache = (st.st_mtime_ns, st.st_size, text)
+        data = json.loads(text)
         # Merge with defaults so new keys are always present
         for key, val in defaults.items():
             data.setdefault(key, val)
-        return data
     except FileNotFoundError:
+        _cache = None
         return defaults
     except Exception:
         logger.debug("Could not load settings, using defaults", exc_info=True)
         return defaults
+    return data
 
 
 def save_settings(settings: Dict[str, Any]) -> None:
     """Persist settings to disk."""
+    global _cache
     try:
         os.makedirs(_SETTINGS_DIR, exist_ok=True)
+        text = json.dumps(settings, indent=2)
         with open(_SETTINGS_FILE, "w", encoding="utf-8") as fh:
-            json.dump(settings, fh, indent=2)
+            fh.write(text)
+        st = os.stat(_SETTINGS_FILE)
+        _cache = (st.st_mtime_ns, st.st_size, text)
     except Exception:
+        _cache = None
         logger.debug("Could not save settings", exc_info=True)
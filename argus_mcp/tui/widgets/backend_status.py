@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from textual.app import ComposeResult
 from textual.message import Message
@@ -23,6 +23,20 @@ _PHASE_STYLE: Dict[str, tuple] = {
     "shutting_down": ("◑", "cyan"),
 }
 
+# Phase → pre-rendered (icon cell, phase label) for the backends table
+_PHASE_CELLS: Dict[str, Tuple[str, str]] = {
+    phase: (f"[{color}]{icon}[/{color}]", phase.title())
+    for phase, (icon, color) in _PHASE_STYLE.items()
+}
+
+# Transport type → plain-text table cell
+_TRANSPORT_PLAIN: Dict[str, str] = {
+    "stdio": "stdio",
+    "sse": "SSE",
+    "streamable-http": "StreamableHTTP",
+    "streamable_http": "StreamableHTTP",
+}
+
 # Transport type → display badge
 _TRANSPORT_BADGE: Dict[str, str] = {
     "stdio": "[cyan]stdio[/cyan]",
@@ -102,26 +116,23 @@ class BackendStatusWidget(Widget):
                 table.clear()
                 for b in details:
                     phase = b.get("phase", "pending")
-                    icon, color = _PHASE_STYLE.get(phase, ("?", "$text-muted"))
+                    cells = _PHASE_CELLS.get(phase)
+                    if cells is None:
+                        cells = ("[$text-muted]?[/$text-muted]", phase.title())
                     name = b.get("name", "?")
                     transport = b.get("type", "?")
                     # Strip Rich markup for table cell — use plain text
-                    transport_plain = {
-                        "stdio": "stdio",
-                        "sse": "SSE",
-                        "streamable-http": "StreamableHTTP",
-                        "streamable_http": "StreamableHTTP",
-                    }.get(transport, transport)
+                    transport_plain = _TRANSPORT_PLAIN.get(transport, transport)
                     latency = b.get("last_latency_ms")
                     if latency is None:
                         health = b.get("health", {})
                         latency = health.get("latency_ms") if isinstance(health, dict) else None
                     lat_str = f"{latency:.0f}ms" if latency else "—"
                     table.add_row(
-                        f"[{color}]{icon}[/{color}]",
+                        cells[0],
                         name,
                         transport_plain,
-                        phase.title(),
+                        cells[1],
                         lat_str,
                         key=name,
                     )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Iterable
 
 from rich.text import Text
 from textual import events
@@ -24,6 +25,32 @@ _STAGE_COLOURS: dict[str, str] = {
 }
 
 
+def _write_event(
+    log: RichLog,
+    stage: str,
+    message: str,
+    timestamp: str | None,
+    extra_lines: list[str] | None,
+    scroll_end: bool | None = None,
+) -> None:
+    """Write one formatted event (header plus indented extra lines) to *log*.
+
+    The extra lines are joined into the same :class:`Text` as the header so
+    the whole event is measured and rendered by a single ``write``.
+    """
+    ts = timestamp or datetime.now().strftime("%H:%M:%S")
+    colour = _STAGE_COLOURS.get(stage, "white")
+
+    entry = Text.assemble(
+        (f"[{ts}] ", "dim"),
+        (f"{stage}: ", colour),
+        (message, "bold"),
+    )
+    if extra_lines:
+        entry.append("\n    " + "\n    ".join(extra_lines))
+    log.write(entry, scroll_end=scroll_end)
+
+
 class _CaptureRichLog(RichLog):
     """RichLog subclass that captures print() output.
 
@@ -100,20 +127,27 @@ class EventLogWidget(Widget):
         extra_lines: list[str] | None = None,
     ) -> None:
         """Append a formatted event entry to the log."""
-        ts = timestamp or datetime.now().strftime("%H:%M:%S")
-        colour = _STAGE_COLOURS.get(stage, "white")
+        _write_event(self.log_widget, stage, message, timestamp, extra_lines)
 
-        header = Text.assemble(
-            (f"[{ts}] ", "dim"),
-            (f"{stage}: ", colour),
-            (message, "bold"),
-        )
-        self.log_widget.write(header)
+    def add_events(
+        self,
+        entries: Iterable[tuple[str, str, str | None, list[str] | None]],
+    ) -> None:
+        """Append several ``(stage, message, timestamp, extra_lines)`` entries.
 
-        if extra_lines:
-            for line in extra_lines:
-                indent = Text.assemble(("    ", ""), (line, ""))
-                self.log_widget.write(indent)
+        Resolves the underlying log once for the whole batch and holds screen
+        updates until every entry is written.  Only the last entry scrolls
+        the log, instead of every line requesting its own scroll.
+        """
+        log = self.log_widget
+        pending = None
+        with self.app.batch_update():
+            for entry in entries:
+                if pending is not None:
+                    _write_event(log, *pending, scroll_end=False)
+                pending = entry
+            if pending is not None:
+                _write_event(log, *pending)
 
     def add_raw(self, text: str) -> None:
         """Append a plain text line."""
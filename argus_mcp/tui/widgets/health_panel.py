@@ -8,13 +8,15 @@ a standalone panel.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Sequence
 
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widget import Widget
 from textual.widgets import DataTable, Label, Static
 
+from argus_mcp.server.management.schemas import BackendDetail
+
 logger = logging.getLogger(__name__)
 
 # Map circuit state to display
@@ -28,8 +30,8 @@ _CIRCUIT_DISPLAY = {
 class HealthPanel(Widget):
     """Shows backend health status, circuit breaker state, and latency.
 
-    Feed data via :meth:`update_from_backends` with a list of backend
-    dicts (from the management API ``/manage/v1/backends`` response).
+    Feed data via :meth:`update_from_backends` with the
+    :class:`BackendDetail` models of a ``/manage/v1/backends`` response.
     """
 
     DEFAULT_CSS = """
@@ -78,8 +80,12 @@ class HealthPanel(Widget):
         except Exception:
             pass
 
-    def update_from_backends(self, backends: List[Dict[str, Any]]) -> None:
-        """Refresh the health table from backend data."""
+    def update_from_backends(self, backends: Sequence[BackendDetail]) -> None:
+        """Refresh the health table from backend data.
+
+        Reads the models' attributes directly, so callers need not
+        ``model_dump()`` them first.
+        """
         try:
             table = self.query_one("#health-table", DataTable)
             table.clear()
@@ -88,14 +94,15 @@ class HealthPanel(Widget):
             circuit_info_lines = []
 
             for b in backends:
-                name = b.get("name", "?")
-                phase = b.get("phase", "unknown").lower()
-                health = b.get("health", {})
-                health_status = health.get("status", "unknown") if health else "unknown"
-                last_check = health.get("last_check", "—") if health else "—"
-                latency = health.get("latency_ms") if health else None
+                name = b.name
+                phase = b.phase.lower()
+                health = b.health
+                health_status = health.status
+                last_check = health.last_check or "—"
+                latency = health.latency_ms
                 lat_str = f"{latency:.0f}ms" if latency else "—"
-                circuit = b.get("circuit_state", "closed")
+                # Circuit-breaker fields are not part of BackendDetail yet
+                circuit = getattr(b, "circuit_state", "closed")
 
                 # Count by health status
                 if phase == "ready" or health_status == "healthy":
@@ -118,8 +125,8 @@ class HealthPanel(Widget):
 
                 # Circuit breaker detail for open/half-open
                 if circuit and circuit != "closed":
-                    failures = b.get("failure_count", "?")
-                    cooldown = b.get("cooldown_remaining", "?")
+                    failures = getattr(b, "failure_count", "?")
+                    cooldown = getattr(b, "cooldown_remaining", "?")
                     circuit_info_lines.append(
                         f"  {name}: {circuit.upper()} — {failures} failures, cooldown: {cooldown}s"
                     )
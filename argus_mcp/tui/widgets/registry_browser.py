@@ -7,7 +7,7 @@ a search input and server detail panel.
 from __future__ import annotations
 
 import logging
-from typing import List
+from typing import Iterable, List, Tuple
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal
@@ -111,6 +111,22 @@ class RegistryBrowserWidget(Widget):
         if event.cursor_row < len(filtered):
             self.post_message(InstallRequested(filtered[event.cursor_row]))
 
+    def extend_entries(self, new_entries: Iterable[ServerEntry]) -> None:
+        """Append *new_entries*, adding only their rows to the table.
+
+        Unlike assigning :attr:`entries`, the rows already shown (and the
+        cursor) are left in place.
+        """
+        new_entries = list(new_entries)
+        self.entries.extend(new_entries)
+        try:
+            table = self.query_one("#registry-table", DataTable)
+        except Exception:
+            return
+        q = self.search_query.lower().strip()
+        table.add_rows(self._row_cells(e) for e in new_entries if self._matches(e, q))
+        self.set_status(f"{table.row_count} servers shown")
+
     def set_status(self, text: str) -> None:
         """Update the status bar text."""
         try:
@@ -120,11 +136,25 @@ class RegistryBrowserWidget(Widget):
 
     # ── internal ────────────────────────────────────────────────────
 
+    @staticmethod
+    def _matches(entry: ServerEntry, q: str) -> bool:
+        return not q or q in entry.name.lower() or q in entry.description.lower()
+
+    @staticmethod
+    def _row_cells(entry: ServerEntry) -> Tuple[str, str, str, str, str]:
+        return (
+            entry.name,
+            entry.transport,
+            str(len(entry.tools)),
+            entry.version or "—",
+            (entry.description[:60] + "…") if len(entry.description) > 60 else entry.description,
+        )
+
     def _filtered_entries(self) -> List[ServerEntry]:
         q = self.search_query.lower().strip()
         if not q:
             return list(self.entries)
-        return [e for e in self.entries if q in e.name.lower() or q in e.description.lower()]
+        return [e for e in self.entries if self._matches(e, q)]
 
     def _refresh_table(self) -> None:
         try:
@@ -132,16 +162,5 @@ class RegistryBrowserWidget(Widget):
         except Exception:
             return
         table.clear()
-        for entry in self._filtered_entries():
-            table.add_row(
-                entry.name,
-                entry.transport,
-                str(len(entry.tools)),
-                entry.version or "—",
-                (
-                    (entry.description[:60] + "…")
-                    if len(entry.description) > 60
-                    else entry.description
-                ),
-            )
-        self.set_status(f"{len(self._filtered_entries())} servers shown")
+        table.add_rows(self._row_cells(entry) for entry in self._filtered_entries())
+        self.set_status(f"{table.row_count} servers shown")
@@ -7,13 +7,15 @@ per group (restart all, stop all, health check).
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widget import Widget
 from textual.widgets import Label, Tree
 
+from argus_mcp.server.management.schemas import BackendDetail
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,7 +42,7 @@ class ServerGroupsWidget(Widget):
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self._groups: Dict[str, List[Dict[str, Any]]] = {}
+        self._groups: Dict[str, List[BackendDetail]] = {}
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -56,13 +58,13 @@ class ServerGroupsWidget(Widget):
 
     def update_groups(
         self,
-        backends: List[Dict[str, Any]],
+        backends: Sequence[BackendDetail],
         groups: Optional[Dict[str, List[str]]] = None,
     ) -> None:
         """Rebuild the server groups tree.
 
         Args:
-            backends: List of backend dicts from the management API.
+            backends: Backend models from the management API.
             groups: Optional mapping of group name → list of backend names.
                     If None, backends are grouped by their 'group' field.
         """
@@ -74,11 +76,11 @@ class ServerGroupsWidget(Widget):
             if groups is None:
                 groups = {}
                 for b in backends:
-                    group_name = b.get("group", "ungrouped") or "ungrouped"
-                    groups.setdefault(group_name, []).append(b.get("name", "?"))
+                    group_name = b.group or "ungrouped"
+                    groups.setdefault(group_name, []).append(b.name)
 
             self._groups = {}
-            backend_map = {b.get("name"): b for b in backends}
+            backend_map = {b.name: b for b in backends}
 
             for group_name, members in sorted(groups.items()):
                 total = len(members)
@@ -88,12 +90,13 @@ class ServerGroupsWidget(Widget):
 
                 group_backends = []
                 for member_name in members:
-                    b = backend_map.get(member_name, {})
-                    phase = b.get("phase", "unknown").lower()
-                    tools = (
-                        b.get("capabilities", {}).get("tools", 0) if b.get("capabilities") else "?"
-                    )
-                    transport = b.get("type", "?")
+                    b = backend_map.get(member_name)
+                    if b is None:
+                        phase, tools, transport = "unknown", "?", "?"
+                    else:
+                        phase = b.phase.lower()
+                        tools = b.capabilities.tools
+                        transport = b.type
 
                     if phase == "ready":
                         icon = "●"
@@ -109,7 +112,8 @@ class ServerGroupsWidget(Widget):
                         icon = "?"
 
                     group_node.add_leaf(f"{icon} {member_name}  {transport}  {tools} tools")
-                    group_backends.append(b)
+                    if b is not None:
+                        group_backends.append(b)
 
                 self._groups[group_name] = group_backends
         except Exception: